@@ -1,52 +1,85 @@
 """Demo the enhanced logger."""
 
-from src.enhanced_logger import (
+import contextlib
+from logging import CRITICAL
+from logging.handlers import MemoryHandler
+
+from loggio import (
     EnhancedLogger,
     get_available_timezones,
     get_logger,
     is_valid_timezone,
 )
 
-logging: EnhancedLogger = get_logger(name="logging_test")
-
-
-logging.info("Hello, world!")
-
-# How truncating messages works.
-long_message = "The path of the righteous man is beset on all sides by the inequities of the selfish and the tyranny of evil men."
-logging.info("Show truncated message: %s", long_message)
-logging.info(
-    "Show truncated message with length specified: %s",
-    long_message,
-    truncate_length=100,
-)
-logging.info(
-    "Show full message with no truncation: %s",
-    long_message,
-    truncate=False,
-)
-
-# How json formatting works.
-json_message: dict = {"key": "value", "key2": "value2", "key3": "value3"}
-logging.info("Demo of json message with no format: %s", json_message)
-logging.info("Demo of json message with format: %s", json_message, json_format=True)
-
-# How debug, warning, error, and critical messages work.
-logging.debug("This is a debug message.")
-logging.warning("This is a warning message.")
-logging.error("This is an error message.")
-logging.critical("This is a critical message.")
-
-# How context works.
-# You can add to context and alter the logger to append to the message.
-logging.info("See UID on the left.", user_context={"uid": "1234567890"})
-
-# You can also set variables for the logger at the instance level.
-logging.truncate = True
-logging.truncate_length = 5
-logging.info("Hello, world!")
 
-# How timezone works.
+@contextlib.contextmanager
+def batched_output(enhanced_logger: EnhancedLogger, capacity: int = 100):
+    """Buffer the logger's output in memory and write it out in one go on exit."""
+    logger = enhanced_logger.get_logger()
+    targets = logger.handlers[:]
+    buffers = [MemoryHandler(capacity, CRITICAL, target) for target in targets]
+    for target, buffer in zip(targets, buffers):
+        logger.removeHandler(target)
+        logger.addHandler(buffer)
+    try:
+        yield
+    finally:
+        for target, buffer in zip(targets, buffers):
+            # Closing a MemoryHandler flushes it but leaves its target open.
+            buffer.close()
+            logger.removeHandler(buffer)
+            logger.addHandler(target)
+
+
+logging: EnhancedLogger = get_logger(name="demo")
+
+with batched_output(logging):
+    logging.info("Hello, world!")
+
+    # How truncating messages works.
+    long_message = "The path of the righteous man is beset on all sides by the inequities of the selfish and the tyranny of evil men."
+    logging.info("Show truncated message: %s", long_message)
+    logging.info(
+        "Show truncated message with length specified: %s",
+        long_message,
+        truncate_length=100,
+    )
+    logging.info(
+        "Show full message with no truncation: %s",
+        long_message,
+        truncate=False,
+    )
+
+    # How json formatting works.
+    json_message: dict = {"key": "value", "key2": "value2", "key3": "value3"}
+    logging.info("Demo of json message with no format: %s", json_message)
+    logging.info(
+        "Demo of json message with format: %s", json_message, json_format=True
+    )
+    logging.info(
+        "Demo of indented json message: %s",
+        json_message,
+        json_format=True,
+        json_indent=4,
+    )
+
+    # How debug, warning, error, and critical messages work.
+    logging.debug("This is a debug message.")
+    logging.warning("This is a warning message.")
+    logging.error("This is an error message.")
+    logging.critical("This is a critical message.")
+
+    # How context works.
+    # You can add to context and alter the logger to append to the message.
+    logging.info("See UID on the left.", user_context={"uid": "1234567890"})
+
+    # You can also set variables for the logger at the instance level.
+    logging.truncate = True
+    logging.truncate_length = 5
+    logging.info("Hello, world!")
+
+# How timezone works. This runs unbuffered because timestamps are rendered when
+# a record is written, using the timezone active at that moment.
 # Reset truncate for clearer output.
 logging.truncate_length = 10000
 
@@ -63,14 +96,15 @@ if is_valid_timezone(tz_to_check):
 if not is_valid_timezone("PST"):
     logging.warning("PST is not valid. Use America/Los_Angeles instead.")
 
-# Change timezone to UTC.
-logging = get_logger(timezone="UTC")
+# Change timezone to UTC. Only the timestamp zone changes; the same logger and
+# handlers keep running.
+logging.set_timezone("UTC")
 logging.info("This message is logged in UTC timezone.")
 
 # Change timezone to Tokyo.
-logging = get_logger(timezone="Asia/Tokyo")
+logging.set_timezone("Asia/Tokyo")
 logging.info("This message is logged in Tokyo timezone.")
 
 # Change timezone to New York.
-logging = get_logger(timezone="America/New_York")
+logging.set_timezone("America/New_York")
 logging.info("This message is logged in New York timezone.")
@@ -1,16 +1,24 @@
 """Logger initialization module.
 
 This module provides easy access to the enhanced logging utilities.
+
+The public names are loaded on first access (PEP 562), so `import loggio`
+does not import `enhanced_logger` and its `zoneinfo` dependency until a name
+from it is used.
 """
 
-from .enhanced_logger import (
-    ColoredFormatter,
-    Colors,
-    EnhancedLogger,
-    get_available_timezones,
-    get_logger,
-    is_valid_timezone,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .enhanced_logger import (
+        ColoredFormatter,
+        Colors,
+        EnhancedLogger,
+        get_available_timezones,
+        get_logger,
+        is_valid_timezone,
+    )
 
 # Set automatically from git tag during Github UI Release creation.
 __version__ = "0.0.0.dev"
@@ -23,3 +31,42 @@ __all__ = [
     "get_available_timezones",
     "is_valid_timezone",
 ]
+
+# Submodule that defines each lazily loaded public name.
+_LAZY_EXPORTS = {name: ".enhanced_logger" for name in __all__}
+
+# Submodules that `import loggio` alone still exposes as attributes.
+_LAZY_SUBMODULES = frozenset({"enhanced_logger"})
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access.
+
+    Args:
+        name: Attribute looked up on the package.
+
+    Returns:
+        The requested class, function or submodule.
+
+    Raises:
+        AttributeError: If the name is not a public export or submodule.
+    """
+    if name in _LAZY_SUBMODULES:
+        # Importing a submodule also sets it as a package attribute.
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+    value = getattr(module, name)
+    # Cache on the package so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the package attributes, including names not yet loaded.
+
+    Returns:
+        The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
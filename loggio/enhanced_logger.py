@@ -1,11 +1,267 @@
 """Enhanced logging module with authentication support."""
 
+import atexit
+import copy
+import functools
+import io
 import json
+import locale
 import logging
-from datetime import datetime
-from typing import Any, ClassVar, Dict, Optional, Tuple, Set
+import os
+import queue
+import re
+import sys
+import threading
+import traceback
+from datetime import datetime, timedelta
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 from zoneinfo import ZoneInfo, available_timezones
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency.
+    orjson = None
+
+# Level constants bound at module scope for the level method fast path.
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+_ERROR = logging.ERROR
+_CRITICAL = logging.CRITICAL
+
+# Message templates compiled once and applied with % in _format_message.
+_UID_TMPL = "%s: %s"
+_TRUNC_TMPL = "%s... [TRUNCATED, LENGTH: %d]"
+_JSON_ERROR_TMPL = "%s - [JSON FORMAT ERROR: %s] - Args: %s"
+_FORMAT_ERROR_TMPL = "%s - [FORMAT ERROR: %s] - Args: %s"
+
+# Format includes timestamp, level, filename, line number, and message.
+# User ID will be included in the message when available.
+_BASE_FORMAT = "%(levelname)s:[%(asctime)s]%(filename)s:%(lineno)d:%(message)s"
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S %Z%z"
+# _DATE_FORMAT as a % template over numeric fields, used by _format_date.
+_DATE_TMPL = "%04d-%02d-%02d %02d:%02d:%02d %s%s%02d%02d"
+
+# Source files whose frames findCaller skips: the logging package itself and
+# importlib's bootstrap, matching the stdlib's own internal-frame check.
+_LOGGING_SRCFILES = frozenset(
+    {
+        logging.Logger.findCaller.__code__.co_filename,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+    }
+)
+
+# How often a flush waiting on the listener checks that it is still running.
+_FLUSH_POLL_SECONDS = 0.1
+
+# Write buffer for the batched file handlers used by async_file and buffer_file.
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# Level name fields per format style, rewritten by ColoredFormatter to read the
+# colored level name; the padding or conversion after the field name is kept.
+_LEVELNAME_FIELD_RES = {
+    "%": re.compile(r"(?<!%)%\(levelname\)"),
+    "{": re.compile(r"(?<!\{)\{levelname(?=[}!:])"),
+    "$": re.compile(r"(?<!\$)\$(?:\{levelname\}|levelname(?![A-Za-z0-9_]))"),
+}
+_COLORED_LEVELNAME_FIELDS = {
+    "%": "%(colored_levelname)",
+    "{": "{colored_levelname",
+    "$": "${colored_levelname}",
+}
+
+# A run of two or more adjacent ANSI SGR (color) escape sequences.
+_SGR_RUN_RE = re.compile(r"(?:\033\[[0-9;]*m){2,}")
+
+# Bound once for the per-record timestamp conversion in ColoredFormatter.
+_fromtimestamp = datetime.fromtimestamp
+_ONE_MINUTE = timedelta(minutes=1)
+
+# Attribute set on every handler this module installs, so a new EnhancedLogger
+# replaces its predecessor's handlers without touching ones added by the user.
+_HANDLER_TAG = "_loggio"
+
+# Separators for compact single-line JSON from the stdlib encoder.
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert an object neither JSON backend serializes natively.
+
+    Enums become their value, as orjson renders them; anything else uses str().
+
+    Args:
+        obj: Object to convert.
+
+    Returns:
+        A JSON-serializable replacement for obj.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _stdlib_json_dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize an object to JSON using the stdlib json module.
+
+    Non-ASCII text is written as-is rather than as \\u escapes, matching orjson.
+
+    Args:
+        obj: Object to serialize. Unsupported types are converted with str().
+        indent: Indentation width, or None for compact single-line JSON.
+
+    Returns:
+        JSON string.
+    """
+    return json.dumps(
+        obj,
+        indent=indent,
+        default=_json_default,
+        ensure_ascii=False,
+        separators=_COMPACT_SEPARATORS if indent is None else None,
+    )
+
+
+if orjson is not None:
+    # Types orjson would otherwise serialize natively are handed to the shared
+    # default, so output matches the stdlib backend, e.g. '2024-01-01 00:00:00'.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _json_dumps(obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize an object to JSON using orjson.
+
+        orjson only supports 2-space indentation, so other indent widths use
+        the stdlib json module.
+
+        Args:
+            obj: Object to serialize. Enums become their value; other unsupported
+                types are converted with str().
+            indent: Indentation width, or None for compact single-line JSON.
+
+        Returns:
+            JSON string.
+        """
+        if indent is None or indent == 2:
+            option = _ORJSON_OPTIONS
+            if indent is not None:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=_json_default, option=option).decode()
+            except orjson.JSONEncodeError:
+                # orjson rejects some input the stdlib accepts, like integers
+                # wider than 64 bits, so fall back to json before reporting an
+                # error.
+                pass
+        return _stdlib_json_dumps(obj, indent)
+
+else:
+    _json_dumps = _stdlib_json_dumps
+
+
+# Scalar types passed through unchanged by json_format. Matched by exact type
+# so bool and None still render as JSON true/false/null.
+_JSON_SCALAR_TYPES = frozenset({str, int, float})
+
+
+def _to_json(arg: Any, indent: Optional[int] = None) -> Any:
+    """Serialize a log argument to JSON, passing plain scalars through.
+
+    Args:
+        arg: Argument to serialize.
+        indent: Indentation width, or None for compact single-line JSON.
+
+    Returns:
+        The argument itself if it is a str, int or float, otherwise its JSON
+        string.
+    """
+    if type(arg) in _JSON_SCALAR_TYPES:
+        return arg
+    return _json_dumps(arg, indent)
+
+
+def _format_date(year, month, day, hour, minute, second, zone_name, offset):
+    """Render timestamp fields as `_DATE_FORMAT` does, without strftime.
+
+    datetime.strftime parses its format string on every call; filling the fixed
+    `_DATE_TMPL` from integers skips that. Local time without a timezone keeps
+    using time.strftime, which is already cheaper than building a datetime.
+
+    Args:
+        year: Four-digit year.
+        month: Month of the year, 1-12.
+        day: Day of the month.
+        hour: Hour, 0-23.
+        minute: Minute, 0-59.
+        second: Second, 0-61.
+        zone_name: Zone abbreviation, such as 'UTC' or 'EST'.
+        offset: UTC offset in whole minutes.
+
+    Returns:
+        The formatted timestamp, e.g. '2023-12-13 20:40:00 UTC+0000'.
+    """
+    sign = "-" if offset < 0 else "+"
+    offset_hours, offset_minutes = divmod(abs(offset), 60)
+    return _DATE_TMPL % (
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        zone_name,
+        sign,
+        offset_hours,
+        offset_minutes,
+    )
+
+
+def _merge_sgr(text: str) -> str:
+    """Merge adjacent ANSI SGR sequences into one escape sequence.
+
+    For example BG_RED + WHITE + BOLD becomes a single '\\033[41;37;1m', so
+    the terminal parses one sequence and fewer bytes are written per record.
+
+    Args:
+        text: String that may contain ANSI SGR escape sequences.
+
+    Returns:
+        The string with each run of SGR sequences merged.
+    """
+    return _SGR_RUN_RE.sub(
+        lambda run: "\033[%sm" % ";".join(run.group()[2:-1].split("m\033[")),
+        text,
+    )
+
+
+def _load_zone(name: str) -> ZoneInfo:
+    """Get the ZoneInfo for an IANA timezone name.
+
+    Args:
+        name: IANA timezone identifier like 'UTC' or 'America/New_York'.
+
+    Returns:
+        The ZoneInfo object.
+
+    Raises:
+        ZoneInfoNotFoundError: If the timezone string is not a valid IANA timezone.
+    """
+    return ZoneInfo(name)
+
+
+# Resolved zones are cached per name so formatters sharing a timezone skip the
+# tzdata lookup. Set LOGGIO_TZ_CACHE=0 to resolve every time, e.g. to profile.
+if os.environ.get("LOGGIO_TZ_CACHE", "1") != "0":
+    _get_zone = functools.lru_cache(maxsize=128)(_load_zone)
+else:
+    _get_zone = _load_zone
+
 
 # ANSI color codes for colored terminal output
 class Colors:
@@ -42,6 +298,18 @@ class Colors:
 class ColoredFormatter(logging.Formatter):
     """Custom formatter to add colors to log messages based on their level."""
 
+    # Nominal only: logging.Formatter has no __slots__, so instances still get
+    # a __dict__ and these declarations save no memory. They list the
+    # attributes this subclass adds.
+    __slots__ = (
+        "use_colors",
+        "timezone",
+        "_colored_style",
+        "_color_record_copy",
+        "_tz_key",
+        "_tzinfo",
+    )
+
     # Color mapping for different log levels
     LEVEL_COLORS = {
         logging.DEBUG: Colors.BRIGHT_BLUE,
@@ -51,6 +319,12 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: f"{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD}",
     }
 
+    # Complete colored level names, built once from the constant colors above.
+    _PRECOLORED = {
+        level: _merge_sgr(f"{color}{logging.getLevelName(level)}{Colors.RESET}")
+        for level, color in LEVEL_COLORS.items()
+    }
+
     def __init__(
         self, fmt=None, datefmt=None, style="%", use_colors=True, timezone=None
     ):
@@ -66,6 +340,43 @@ class ColoredFormatter(logging.Formatter):
         super().__init__(fmt, datefmt, style)
         self.use_colors = use_colors
         self.timezone = timezone
+        # Resolved tzinfo, kept until `timezone` is changed; see _get_tzinfo().
+        self._tz_key = None
+        self._tzinfo = None
+
+        # The format string is fixed, so colorize it once instead of per record.
+        # The level name is read from a separate record attribute so the
+        # record's own levelname never carries ANSI codes to other handlers.
+        # Any padding or conversion on the level name field is kept.
+        colored_fmt, level_fields = _LEVELNAME_FIELD_RES[style].subn(
+            _COLORED_LEVELNAME_FIELDS[style], self._style._fmt
+        )
+        # A level name the rewrite cannot reach is colored on a record copy.
+        self._color_record_copy = not level_fields and "levelname" in colored_fmt
+        colored_fmt = colored_fmt.replace(
+            "%(filename)s:%(lineno)d",
+            f"{Colors.CYAN}%(filename)s:%(lineno)d{Colors.RESET}",
+        ).replace("%(asctime)s", f"{Colors.BOLD}%(asctime)s{Colors.RESET}")
+        self._colored_style = type(self._style)(_merge_sgr(colored_fmt))
+
+    def _get_tzinfo(self):
+        """Resolve the configured timezone to a tzinfo object.
+
+        The result is kept for as long as `timezone` holds the same object, so
+        records only pay for an identity check instead of a zone lookup.
+
+        Returns:
+            The tzinfo for the configured timezone.
+
+        Raises:
+            ZoneInfoNotFoundError: If the timezone string is not a valid IANA timezone.
+        """
+        timezone = self.timezone
+        if timezone is not self._tz_key:
+            tzinfo = _get_zone(timezone) if isinstance(timezone, str) else timezone
+            self._tz_key = timezone
+            self._tzinfo = tzinfo
+        return self._tzinfo
 
     def converter(self, timestamp):
         """Convert timestamp to the specified timezone.
@@ -77,12 +388,7 @@ class ColoredFormatter(logging.Formatter):
             time.struct_time in the specified timezone.
         """
         if self.timezone:
-            if isinstance(self.timezone, str):
-                tz = ZoneInfo(self.timezone)
-            else:
-                tz = self.timezone
-            dt = datetime.fromtimestamp(timestamp, tz=tz)
-            return dt.timetuple()
+            return _fromtimestamp(timestamp, tz=self._get_tzinfo()).timetuple()
         return super().converter(timestamp)
 
     def formatTime(self, record, datefmt=None):
@@ -100,18 +406,26 @@ class ColoredFormatter(logging.Formatter):
         """
         if self.timezone:
             try:
-                if isinstance(self.timezone, str):
-                    tz = ZoneInfo(self.timezone)
-                else:
-                    tz = self.timezone
-                dt = datetime.fromtimestamp(record.created, tz=tz)
+                dt = _fromtimestamp(record.created, tz=self._get_tzinfo())
+                if datefmt == _DATE_FORMAT:
+                    offset = dt.utcoffset()
+                    if offset is not None and not offset % _ONE_MINUTE:
+                        return _format_date(
+                            dt.year,
+                            dt.month,
+                            dt.day,
+                            dt.hour,
+                            dt.minute,
+                            dt.second,
+                            dt.tzname() or "",
+                            offset // _ONE_MINUTE,
+                        )
                 if datefmt:
                     return dt.strftime(datefmt)
                 else:
                     return dt.isoformat()
             except Exception as e:
                 # If timezone is invalid, fall back to default and log warning
-                import sys
                 print(
                     f"WARNING: Invalid timezone '{self.timezone}': {e}. "
                     f"Falling back to local time. Use get_available_timezones() "
@@ -122,49 +436,401 @@ class ColoredFormatter(logging.Formatter):
                 return super().formatTime(record, datefmt)
         return super().formatTime(record, datefmt)
 
-    def format(self, record):
-        """Format the log record with appropriate colors.
+    def formatMessage(self, record):
+        """Render the record with the colored format when colors are enabled.
 
         Args:
             record: The log record to format.
 
         Returns:
-            Formatted log message with color codes if enabled.
+            The record rendered with the colored or plain format string.
         """
-        # Save the original format
-        original_format = self._style._fmt
-
         if self.use_colors:
-            # Get the color for the current log level
-            level_color = self.LEVEL_COLORS.get(record.levelno, Colors.RESET)
+            colored_levelname = self._PRECOLORED.get(record.levelno, record.levelname)
+            if self._color_record_copy:
+                record = copy.copy(record)
+                record.levelname = colored_levelname
+            else:
+                record.colored_levelname = colored_levelname
+            return self._colored_style.format(record)
+        return self._style.format(record)
+
+
+class _FastLogger(logging.Logger):
+    """Logger whose caller lookup checks frames against a precomputed set.
+
+    The stdlib normalizes and compares each frame's filename on every record.
+    Here each frame costs a single frozenset lookup. The stacklevel semantics
+    match `logging.Logger.findCaller` on Python 3.11+.
+    """
+
+    def findCaller(self, stack_info=False, stacklevel=1):
+        """Find the caller's source file, line number and function name.
+
+        Args:
+            stack_info: Whether to include the formatted call stack.
+            stacklevel: Number of frames outside the logging package to walk
+                up, counting from the logging call.
+
+        Returns:
+            Tuple of (filename, line number, function name, stack info).
+        """
+        f = sys._getframe()
+        while stacklevel > 0:
+            next_f = f.f_back
+            if next_f is None:
+                break
+            f = next_f
+            if f.f_code.co_filename not in _LOGGING_SRCFILES:
+                stacklevel -= 1
+        co = f.f_code
+        sinfo = None
+        if stack_info:
+            with io.StringIO() as sio:
+                sio.write("Stack (most recent call last):\n")
+                traceback.print_stack(f, file=sio)
+                sinfo = sio.getvalue()
+                if sinfo[-1] == "\n":
+                    sinfo = sinfo[:-1]
+        return co.co_filename, f.f_lineno, co.co_name, sinfo
+
+
+def _get_std_logger(name: str) -> logging.Logger:
+    """Get the named stdlib logger, creating it as a `_FastLogger` if new.
+
+    The manager's logger class is only swapped while the logger is created,
+    under the logging module lock that `logging.getLogger` also takes, so other
+    threads never create a logger with the temporary class. The process-wide
+    `logging.setLoggerClass` setting is never touched.
+
+    Args:
+        name: Name of the logger.
+
+    Returns:
+        The logger registered under name.
+    """
+    if not name or name == logging.root.name:
+        # logging.getLogger returns the root logger for these names.
+        return logging.root
+    manager = logging.Logger.manager
+    with logging._lock:
+        logger_class = manager.loggerClass
+        manager.loggerClass = _FastLogger
+        try:
+            return manager.getLogger(name)
+        finally:
+            manager.loggerClass = logger_class
+
+
+class _LazyMessage:
+    """Log message whose formatting is deferred until a handler emits it.
+
+    `logging.LogRecord.getMessage` calls `str()` on the record message, so
+    records dropped by a filter or handler never pay for formatting. The result
+    is cached so multiple handlers share a single formatting pass.
+
+    This object, not a `str`, is the record's `msg`: `len()`, `%`, `==` and
+    `json.dumps()` do not treat it as a string. Use `record.getMessage()` or
+    `str(record.msg)` in filters; string methods such as
+    `record.msg.startswith()` are forwarded to the formatted message for
+    compatibility. The level methods resolve the instance settings and check
+    argument types when they are called, so only the arguments are read at emit
+    time, as with `%`-style arguments in the standard library.
+    """
+
+    __slots__ = ("_format", "_format_args", "_message")
+
+    def __init__(self, format_fn, format_args: Tuple[Any, ...]) -> None:
+        """Initialize the lazy message.
+
+        Args:
+            format_fn: Callable producing the final message string.
+            format_args: Positional arguments passed to format_fn.
+        """
+        self._format = format_fn
+        self._format_args = format_args
+        self._message = None
+
+    def __str__(self) -> str:
+        """Format the message on first use.
+
+        Returns:
+            The formatted message.
+        """
+        if self._message is None:
+            self._message = self._format(*self._format_args)
+        return self._message
+
+    def __repr__(self) -> str:
+        """Describe the message without formatting it.
+
+        `logging.Handler.handleError` prints the record's `msg` when formatting
+        fails, so this must not format again.
+
+        Returns:
+            The formatted message's repr if available, else the raw template.
+        """
+        if self._message is not None:
+            return repr(self._message)
+        return "<_LazyMessage %r>" % (self._format_args[0],)
 
-            # Colorize the level name
-            record.levelname = f"{level_color}{record.levelname}{Colors.RESET}"
+    def __getattr__(self, name):
+        """Forward string methods, e.g. `startswith`, to the formatted message.
 
-            # Colorize the filename and line number
-            file_info = f"{Colors.CYAN}%(filename)s:%(lineno)d{Colors.RESET}"
-            self._style._fmt = original_format.replace(
-                "%(filename)s:%(lineno)d", file_info
+        Args:
+            name: Attribute looked up on the message.
+
+        Returns:
+            The attribute of the formatted message string.
+
+        Raises:
+            AttributeError: For private and dunder names, so copy and pickle
+                protocol lookups never trigger formatting.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Stream handler that writes to whatever `sys.stderr` is at emit time.
+
+    A plain StreamHandler keeps the stream it was created with, so output
+    redirected later (contextlib.redirect_stderr, pytest capture) still goes to
+    the old, possibly closed, stream. This mirrors `logging.lastResort`. A
+    stream set explicitly, e.g. with `setStream()`, is used instead.
+    """
+
+    def __init__(self, level=logging.NOTSET):
+        """Initialize the handler without binding a stream.
+
+        Args:
+            level: Minimum level of records to handle.
+        """
+        logging.Handler.__init__(self, level)
+        self._stream = None
+
+    @property
+    def stream(self):
+        """The explicitly set stream, or else the current `sys.stderr`."""
+        if self._stream is None:
+            return sys.stderr
+        return self._stream
+
+    @stream.setter
+    def stream(self, stream):
+        """Write to stream from now on; None goes back to `sys.stderr`."""
+        self._stream = stream
+
+
+class _BatchedFileHandler(logging.FileHandler):
+    """File handler that leaves flushing to its owner.
+
+    Records are encoded into an in-memory byte buffer and written to the file
+    with one raw `os.write` once `_FILE_BUFFER_SIZE` bytes have built up, so a
+    burst of records reaches the disk in a few large writes instead of one
+    syscall per record, without the text and buffered I/O layers in between.
+    `flush()` and `close()` write out the rest; with `async_file` the
+    `_FileQueueListener` flushes it whenever the queue drains.
+    """
+
+    def __init__(self, filename, mode="a", encoding=None, delay=False, errors=None):
+        """Initialize the handler and its write buffer.
+
+        Args:
+            filename: Path of the log file.
+            mode: Text mode to open the file in; opened unbuffered in binary.
+            encoding: Encoding for records. None uses the locale encoding.
+            delay: Whether to defer opening the file until the first record.
+            errors: How encoding errors are handled. None means 'strict'.
+        """
+        self._buffer = bytearray()
+        super().__init__(filename, mode, encoding, delay, errors)
+        encoding = self.encoding
+        if encoding is None or encoding == "locale":
+            encoding = locale.getpreferredencoding(False)
+        self._codec = encoding
+        self._codec_errors = self.errors or "strict"
+
+    def _open(self):
+        """Open the log file unbuffered, so each write is a single syscall.
+
+        Returns:
+            The raw binary file object.
+        """
+        return open(self.baseFilename, self.mode + "b", buffering=0)
+
+    def emit(self, record):
+        """Add the record to the write buffer, writing out a full buffer.
+
+        Args:
+            record: The log record to write.
+        """
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self._buffer += (self.format(record) + self.terminator).encode(
+                self._codec, self._codec_errors
             )
+            if len(self._buffer) >= _FILE_BUFFER_SIZE:
+                self._write_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Write out the buffered records."""
+        self.acquire()
+        try:
+            if self.stream is not None and self._buffer:
+                self._write_buffer()
+        finally:
+            self.release()
+
+    def _write_buffer(self):
+        """Write the whole buffer to the file descriptor and clear it."""
+        fd = self.stream.fileno()
+        written = 0
+        try:
+            with memoryview(self._buffer) as view:
+                while written < len(view):
+                    # os.write may write less than asked for; retry the rest.
+                    written += os.write(fd, view[written:])
+        finally:
+            del self._buffer[:written]
+
+
+class _BufferedFileHandler(_BatchedFileHandler):
+    """Batched file handler that flushes on errors, used by `buffer_file`.
+
+    Records below ERROR stay in the write buffer until it fills, `flush()` is
+    called, or logging shuts down at interpreter exit. ERROR and above are
+    flushed at once so they reach the disk even if the process then dies.
+    """
+
+    def emit(self, record):
+        """Write the record, flushing immediately if it is ERROR or above.
+
+        Args:
+            record: The log record to write.
+        """
+        super().emit(record)
+        if record.levelno >= _ERROR:
+            self.flush()
+
+
+class _FlushRequest:
+    """Queue marker asking the listener to flush once it has written earlier records."""
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        """Initialize the marker with an unset completion event."""
+        self.done = threading.Event()
+
+
+class _FileQueueListener(QueueListener):
+    """Queue listener that flushes its handlers whenever the queue drains."""
+
+    def dequeue(self, block):
+        """Get the next record, flushing handlers before waiting for one.
+
+        Args:
+            block: Whether to block until a record is available.
+
+        Returns:
+            The next record from the queue.
+        """
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+    def handle(self, record):
+        """Write a record, or flush and signal the caller for a flush marker.
+
+        Args:
+            record: The queued record or `_FlushRequest`.
+        """
+        if isinstance(record, _FlushRequest):
+            for handler in self.handlers:
+                handler.flush()
+            record.done.set()
+            return
+        super().handle(record)
+
+    def flush(self):
+        """Wait until every record queued so far is written and flushed.
+
+        The listener keeps running, so concurrent calls are safe; each waits for
+        its own marker to pass through the queue.
+        """
+        request = _FlushRequest()
+        self.queue.put_nowait(request)
+        # Stop waiting if the listener is stopped before reaching the marker.
+        while not request.done.wait(_FLUSH_POLL_SECONDS):
+            if self._thread is None:
+                break
+
+    def stop(self):
+        """Stop the listener after writing and flushing queued records."""
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
 
-            # Add bold to timestamp
-            time_info = f"{Colors.BOLD}%(asctime)s{Colors.RESET}"
-            self._style._fmt = self._style._fmt.replace("%(asctime)s", time_info)
+class _ListenerQueueHandler(QueueHandler):
+    """QueueHandler that owns the background listener draining its queue.
 
-        # Format the record
-        result = super().format(record)
+    Closing the handler, e.g. when a new EnhancedLogger replaces it, stops the
+    listener thread and closes its file, so no listener outlives its handler.
+    """
+
+    def __init__(self, record_queue, listener: _FileQueueListener) -> None:
+        """Initialize the handler and start its listener.
+
+        Args:
+            record_queue: Queue the listener reads from.
+            listener: Listener writing the queued records; started here.
+        """
+        super().__init__(record_queue)
+        self.listener = listener
+        listener.start()
+        atexit.register(self.stop_listener)
+
+    def stop_listener(self) -> None:
+        """Stop the listener after it writes queued records, and close its file."""
+        self.acquire()
+        try:
+            listener, self.listener = self.listener, None
+        finally:
+            self.release()
+        if listener is None:
+            return
+        atexit.unregister(self.stop_listener)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
-        # Restore the original format
-        self._style._fmt = original_format
+    def flush(self):
+        """Wait for the listener to write and flush every queued record."""
+        listener = self.listener
+        if listener is not None:
+            listener.flush()
 
-        return result
+    def close(self):
+        """Stop the listener, then close the handler."""
+        self.stop_listener()
+        super().close()
 
 
 class EnhancedLogger:
     """Enhanced logging mechanism with authentication context.
 
-    Implemented as a singleton to ensure only one logger instance exists
-    across the whole program.
+    Use `get_logger()` to share a single instance across the whole program.
+    Constructing `EnhancedLogger` directly always creates and configures a new
+    instance.
 
     Stacklevel 2 is used to show the source of the log call and not the logger
     method itself.
@@ -192,6 +858,9 @@ class EnhancedLogger:
 
         logger.info("Received data %s", complex_data, json_format=True)
 
+        # With indented JSON instead of the compact single-line default
+        logger.info("Received data %s", complex_data, json_format=True, json_indent=4)
+
         # With truncation explicitly set to False for long messages
         logger.info("Very long message that should not be truncated", truncate=False)
 
@@ -222,20 +891,36 @@ class EnhancedLogger:
     - Optional JSON formatting for complex data structures
     - Automatic truncation of long messages with option to disable
     - Colored terminal output for better readability
-    - Singleton implementation to ensure only one logger instance exists
+    - Shared instance through `get_logger()` for consistent configuration
     - Configurable timezone for timestamps (UTC, US/Pacific, Europe/London, etc.)
     """
 
-    # Class variable to store the singleton instance
-    _instance: ClassVar[Optional["EnhancedLogger"]] = None
-    _initialized: ClassVar[bool] = False
-
-    def __new__(cls, *args, **kwargs):
-        """Ensure only one instance of EnhancedLogger exists."""
-        if cls._instance is None:
-            cls._instance = super(EnhancedLogger, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    __slots__ = (
+        "name",
+        "level",
+        "terminal",
+        "fileout_path",
+        "json_format",
+        "truncate_length",
+        "truncate",
+        "use_colors",
+        "timezone",
+        "propagate",
+        "async_file",
+        "buffer_file",
+        "logger",
+        "_isEnabledFor",
+        "_debug_fn",
+        "_info_fn",
+        "_warning_fn",
+        "_error_fn",
+        "_critical_fn",
+        "_file_config",
+        "_terminal_config",
+        "_file_handler",
+        "_terminal_handler",
+        "_listener",
+    )
 
     def __init__(
         self,
@@ -249,6 +934,8 @@ class EnhancedLogger:
         use_colors: bool = True,
         timezone: str = None,
         propagate: bool = False,
+        async_file: bool = False,
+        buffer_file: bool = False,
     ) -> None:
         """Initialize enhanced logging mechanism.
 
@@ -267,11 +954,13 @@ class EnhancedLogger:
             propagate: Whether to propagate log records to the root logger.
                 Set to True for pytest --log-cli-level compatibility.
                 Default is False.
+            async_file: Whether to write file output from a background thread
+                through a queue, batching writes. Call flush() to make sure
+                queued records are on disk. Default is False.
+            buffer_file: Whether to buffer file output in memory and only flush
+                on ERROR and above, flush(), or exit. Ignored with async_file,
+                which already batches writes. Default is False.
         """
-        # Skip initialization if already initialized.
-        if self._initialized:
-            return
-
         self.name = name
         self.level = level
         self.terminal = terminal
@@ -282,46 +971,28 @@ class EnhancedLogger:
         self.use_colors = use_colors
         self.timezone = timezone
         self.propagate = propagate
+        self.async_file = async_file
+        self.buffer_file = buffer_file
 
-        self.logger = logging.getLogger(self.name)
+        self.logger = _get_std_logger(self.name)
         self.logger.propagate = self.propagate
         self.logger.setLevel(self.level)
 
-        # Format includes timestamp, level, filename, line number, and message
-        # User ID will be included in the message when available.
-        base_format = "%(levelname)s:[%(asctime)s]%(filename)s:%(lineno)d:%(message)s"
-        date_format = "%Y-%m-%d %H:%M:%S %Z%z"
-
-        # Clear existing handlers to avoid duplicates.
-        if self.logger.handlers:
-            self.logger.handlers.clear()
-
-        if self.fileout_path:
-            # Regular formatter for file output (no colors)
-            file_formatter = ColoredFormatter(
-                fmt=base_format,
-                datefmt=date_format,
-                use_colors=False,
-                timezone=self.timezone,
-            )
-            file_handler = logging.FileHandler(self.fileout_path, "a")
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
-
-        if self.terminal:
-            # Colored formatter for terminal output
-            terminal_formatter = ColoredFormatter(
-                fmt=base_format,
-                datefmt=date_format,
-                use_colors=self.use_colors,
-                timezone=self.timezone,
-            )
-            terminal_handler = logging.StreamHandler()
-            terminal_handler.setFormatter(terminal_formatter)
-            self.logger.addHandler(terminal_handler)
-
-        # Mark as initialized
-        self._initialized = True
+        # Bound once so disabled levels return before any formatting work and
+        # emitting skips the self.logger attribute and method lookups.
+        self._isEnabledFor = self.logger.isEnabledFor
+        self._debug_fn = self.logger.debug
+        self._info_fn = self.logger.info
+        self._warning_fn = self.logger.warning
+        self._error_fn = self.logger.error
+        self._critical_fn = self.logger.critical
+
+        self._file_config = None
+        self._terminal_config = None
+        self._file_handler = None
+        self._terminal_handler = None
+        self._listener = None
+        self._install_handlers()
 
     def reconfigure(
         self,
@@ -335,6 +1006,8 @@ class EnhancedLogger:
         use_colors: bool = None,
         timezone: str = None,
         propagate: bool = None,
+        async_file: bool = None,
+        buffer_file: bool = None,
     ) -> None:
         """Reconfigure the logger instance.
 
@@ -351,6 +1024,10 @@ class EnhancedLogger:
                 'US/Pacific', 'Europe/London', etc. Default is None (unchanged).
             propagate: Whether to propagate log records to the root logger.
                 Default is None (unchanged).
+            async_file: Whether to write file output from a background thread.
+                Default is None (unchanged).
+            buffer_file: Whether to buffer file output and flush on errors.
+                Default is None (unchanged).
         """
         # Update only specified parameters
         if name is not None:
@@ -373,34 +1050,172 @@ class EnhancedLogger:
         if propagate is not None:
             self.propagate = propagate
             self.logger.propagate = self.propagate
-        if timezone is not None:
-            self.timezone = timezone
+        if async_file is not None:
+            self.async_file = async_file
+        if buffer_file is not None:
+            self.buffer_file = buffer_file
 
         # Reconfigure handlers
-        base_format = "%(levelname)s:[%(asctime)s]%(filename)s:%(lineno)d:%(message)s"
-        date_format = "%Y-%m-%d %H:%M:%S %Z%z"
+        self._install_handlers()
+        if timezone is not None:
+            self.set_timezone(timezone)
+
+    def set_timezone(self, timezone) -> None:
+        """Switch the timezone used for timestamps without rebuilding handlers.
+
+        Only the installed formatters' timezone is swapped, so the log file stays
+        open and the zone is resolved through the shared zone cache.
+
+        Args:
+            timezone: Timezone to display timestamps in. Can be a ZoneInfo object
+                or string like 'UTC', 'US/Pacific'. None uses local time.
+        """
+        self.timezone = timezone
+        handlers = list(self.logger.handlers)
+        if self._listener is not None:
+            handlers.extend(self._listener.handlers)
+        for handler in handlers:
+            if handler is not None and isinstance(handler.formatter, ColoredFormatter):
+                handler.formatter.timezone = timezone
+
+    def _install_handlers(self) -> None:
+        """Install the file and terminal handlers for the current configuration.
+
+        Each handler is only rebuilt when an option it depends on changed since
+        the last install, so repeated `get_logger()` calls with the same options
+        keep the existing handlers, and changing terminal options keeps the open
+        log file. Timezone changes never rebuild handlers; see `set_timezone()`.
+        """
+        file_config = (self.fileout_path, self.async_file, self.buffer_file)
+        terminal_config = (self.terminal, self.use_colors)
+        file_changed = file_config != self._file_config
+        terminal_changed = terminal_config != self._terminal_config
+        if not file_changed and not terminal_changed:
+            return
 
-        # Clear existing handlers to avoid duplicates
-        if self.logger.handlers:
-            self.logger.handlers.clear()
+        if self._file_config is None and self._terminal_config is None:
+            # First install: remove and close handlers an earlier EnhancedLogger
+            # left on the named logger to avoid duplicates, keeping the user's.
+            for handler in self.logger.handlers[:]:
+                if getattr(handler, _HANDLER_TAG, False):
+                    self.logger.removeHandler(handler)
+                    handler.close()
+
+        if file_changed:
+            self._file_config = file_config
+            self._remove_file_handler()
+            if self.fileout_path:
+                self._file_handler = self._build_file_handler()
+                self.logger.addHandler(self._file_handler)
+            if not terminal_changed and self._terminal_handler is not None:
+                # Re-add the kept terminal handler so file output stays first.
+                self.logger.removeHandler(self._terminal_handler)
+                self.logger.addHandler(self._terminal_handler)
+
+        if terminal_changed:
+            self._terminal_config = terminal_config
+            if self._terminal_handler is not None:
+                self.logger.removeHandler(self._terminal_handler)
+                self._terminal_handler.close()
+                self._terminal_handler = None
+            if self.terminal:
+                self._terminal_handler = self._build_terminal_handler()
+                self.logger.addHandler(self._terminal_handler)
+
+    def _build_file_handler(self) -> logging.Handler:
+        """Build the handler for file output.
 
-        if self.fileout_path:
-            # Regular formatter for file output (no colors)
-            file_formatter = ColoredFormatter(
-                fmt=base_format, datefmt=date_format, use_colors=False, timezone=self.timezone
+        Returns:
+            A FileHandler (write-buffered with `buffer_file`), or with
+            `async_file` a QueueHandler feeding a started background listener
+            that owns the file.
+        """
+        # Regular formatter for file output (no colors)
+        file_formatter = ColoredFormatter(
+            fmt=_BASE_FORMAT,
+            datefmt=_DATE_FORMAT,
+            use_colors=False,
+            timezone=self.timezone,
+        )
+        if self.async_file:
+            # The listener thread owns the file; callers only enqueue.
+            file_handler = _BatchedFileHandler(self.fileout_path, "a")
+            file_handler.setFormatter(file_formatter)
+            record_queue = queue.SimpleQueue()
+            queue_handler = _ListenerQueueHandler(
+                record_queue, _FileQueueListener(record_queue, file_handler)
             )
+            self._listener = queue_handler.listener
+            setattr(queue_handler, _HANDLER_TAG, True)
+            return queue_handler
+        if self.buffer_file:
+            file_handler = _BufferedFileHandler(self.fileout_path, "a")
+        else:
             file_handler = logging.FileHandler(self.fileout_path, "a")
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+        file_handler.setFormatter(file_formatter)
+        setattr(file_handler, _HANDLER_TAG, True)
+        return file_handler
 
-        if self.terminal:
-            # Colored formatter for terminal output
-            terminal_formatter = ColoredFormatter(
-                fmt=base_format, datefmt=date_format, use_colors=self.use_colors, timezone=self.timezone
-            )
-            terminal_handler = logging.StreamHandler()
-            terminal_handler.setFormatter(terminal_formatter)
-            self.logger.addHandler(terminal_handler)
+    def _build_terminal_handler(self) -> logging.Handler:
+        """Build the handler for terminal output.
+
+        Returns:
+            A _StderrHandler with the colored formatter.
+        """
+        # Colored formatter for terminal output
+        terminal_formatter = ColoredFormatter(
+            fmt=_BASE_FORMAT,
+            datefmt=_DATE_FORMAT,
+            use_colors=self.use_colors,
+            timezone=self.timezone,
+        )
+        terminal_handler = _StderrHandler()
+        terminal_handler.setFormatter(terminal_formatter)
+        setattr(terminal_handler, _HANDLER_TAG, True)
+        return terminal_handler
+
+    def add_stream_handler(self, stream) -> logging.Handler:
+        """Also write formatted records to a stream, such as an `io.StringIO`.
+
+        The handler uses the uncolored file format and is kept when the file or
+        terminal output is reconfigured. A new EnhancedLogger with the same name
+        removes it along with the other handlers this module installed.
+
+        Args:
+            stream: File-like object with `write()` and `flush()` methods.
+
+        Returns:
+            The installed StreamHandler, for removing it again.
+        """
+        stream_formatter = ColoredFormatter(
+            fmt=_BASE_FORMAT,
+            datefmt=_DATE_FORMAT,
+            use_colors=False,
+            timezone=self.timezone,
+        )
+        stream_handler = logging.StreamHandler(stream)
+        stream_handler.setFormatter(stream_formatter)
+        setattr(stream_handler, _HANDLER_TAG, True)
+        self.logger.addHandler(stream_handler)
+        return stream_handler
+
+    def _remove_file_handler(self) -> None:
+        """Remove and close the file handler, stopping its listener, if any."""
+        if self._file_handler is not None:
+            self.logger.removeHandler(self._file_handler)
+            self._file_handler.close()
+            self._file_handler = None
+        self._listener = None
+
+    def flush(self) -> None:
+        """Write out log records that are still queued or buffered.
+
+        With `async_file=True`, this waits for the background thread to write
+        every record queued so far before flushing the file. It is safe to call
+        from several threads at once.
+        """
+        for handler in self.logger.handlers:
+            handler.flush()
 
     def _format_message(
         self,
@@ -410,6 +1225,7 @@ class EnhancedLogger:
         json_format: bool = False,
         truncate: bool = None,
         truncate_length: int = None,
+        json_indent: Optional[int] = None,
     ) -> str:
         """Format message with format strings and user ID if available.
 
@@ -422,50 +1238,108 @@ class EnhancedLogger:
                 instance default.
             truncate_length: Maximum length for log messages before truncation.
                 If None, uses the instance default.
+            json_indent: Indentation width for JSON formatted args. Defaults to
+                None (compact single-line JSON).
 
         Returns:
             Formatted message with user ID if available and format string
             substitutions.
         """
-        formatted_args = args
-
-        # Format args as JSON if requested.
-        if json_format and args:
-            try:
-                formatted_args = tuple(
-                    json.dumps(arg, indent=4, default=str) for arg in args
-                )
-            except (TypeError, ValueError) as e:
-                # If JSON formatting fails, append error to message.
-                return f"{message} - [JSON FORMAT ERROR: {str(e)}] - Args: {args}"
-
-        # Apply string formatting if args are provided.
-        if formatted_args:
+        # Plain messages without args or context go straight to truncation.
+        if args:
+            formatted_args = args
+
+            # Format args as JSON if requested.
+            if json_format:
+                try:
+                    formatted_args = tuple(_to_json(arg, json_indent) for arg in args)
+                except (TypeError, ValueError) as e:
+                    # If JSON formatting fails, append error to message.
+                    return _JSON_ERROR_TMPL % (message, e, args)
+
+            # Apply string formatting.
             try:
                 message = message % formatted_args
             except (TypeError, ValueError) as e:
                 # If formatting fails, append args to message.
-                message = (
-                    f"{message} - [FORMAT ERROR: {str(e)}] - Args: {formatted_args}"
-                )
+                message = _FORMAT_ERROR_TMPL % (message, e, formatted_args)
 
         # Add user context if available.
-        if user_context and "uid" in user_context:
-            message = f"{user_context['uid']}: {message}"
+        if user_context:
+            uid = user_context.get("uid")
+            if uid is not None:
+                message = _UID_TMPL % (uid, message)
 
         # Use function parameters first, then fall back to instance variables.
         should_truncate: bool = truncate if truncate is not None else self.truncate
-        max_length: int = (
-            truncate_length if truncate_length is not None else self.truncate_length
-        )
 
-        # Apply truncate and length if specified.
-        if should_truncate and len(message) > max_length:
-            truncated_message: str = message[:max_length]
-            return f"{truncated_message}... [TRUNCATED, LENGTH: {len(message)}]"
+        # Only measure the message when truncation is enabled.
+        if should_truncate:
+            max_length: int = (
+                truncate_length
+                if truncate_length is not None
+                else self.truncate_length
+            )
+            length = len(message)
+            if length > max_length:
+                return _TRUNC_TMPL % (message[:max_length], length)
 
         return message
 
+    def _make_message(
+        self,
+        message: str,
+        args: Tuple[Any, ...],
+        user_context: Optional[Dict[str, Any]],
+        json_format: bool,
+        truncate: Optional[bool],
+        truncate_length: Optional[int],
+        json_indent: Optional[int],
+    ) -> _LazyMessage:
+        """Build the deferred message for one log call.
+
+        Truncation settings left as None are resolved from the instance now, so
+        later changes to the instance do not alter records already logged.
+
+        Args:
+            message: The log message, possibly with format specifiers.
+            args: Arguments for format string substitution.
+            user_context: Optional user authentication context.
+            json_format: Whether to format args as JSON.
+            truncate: Whether to truncate the message, or None for the default.
+            truncate_length: Maximum message length, or None for the default.
+            json_indent: Indentation width for JSON formatted args.
+
+        Returns:
+            A message that runs `_format_message()` when first rendered.
+
+        Raises:
+            TypeError: If user_context is not a dict or truncate_length is not
+                an int, checked here since formatting runs later.
+        """
+        if user_context is not None and not isinstance(user_context, dict):
+            raise TypeError(
+                f"user_context must be a dict, not {type(user_context).__name__}"
+            )
+        if truncate_length is None:
+            truncate_length = self.truncate_length
+        elif not isinstance(truncate_length, int):
+            raise TypeError(
+                f"truncate_length must be an int, not {type(truncate_length).__name__}"
+            )
+        return _LazyMessage(
+            self._format_message,
+            (
+                message,
+                args,
+                user_context,
+                json_format,
+                self.truncate if truncate is None else truncate,
+                truncate_length,
+                json_indent,
+            ),
+        )
+
     def debug(
         self,
         message: str,
@@ -474,6 +1348,7 @@ class EnhancedLogger:
         json_format: bool = False,
         truncate: bool = None,
         truncate_length: int = None,
+        json_indent: Optional[int] = None,
     ) -> None:
         """Log a debug message.
 
@@ -488,11 +1363,25 @@ class EnhancedLogger:
                 instance default.
             truncate_length: Maximum length for log messages before truncation.
                 If None, uses the instance default.
+            json_indent: Indentation width for JSON formatted args. Defaults to
+                None (compact single-line JSON).
+
+        Raises:
+            TypeError: If the level is enabled and user_context is not a dict or
+                truncate_length is not an int.
         """
-        formatted_message = self._format_message(
-            message, args, user_context, json_format, truncate, truncate_length
+        if not self._isEnabledFor(_DEBUG):
+            return
+        message = self._make_message(
+            message,
+            args,
+            user_context,
+            json_format,
+            truncate,
+            truncate_length,
+            json_indent,
         )
-        self.logger.debug(formatted_message, stacklevel=2)
+        self._debug_fn(message, stacklevel=2)
 
     def info(
         self,
@@ -502,6 +1391,7 @@ class EnhancedLogger:
         json_format: bool = False,
         truncate: bool = None,
         truncate_length: int = None,
+        json_indent: Optional[int] = None,
     ) -> None:
         """Log an info message.
 
@@ -516,11 +1406,25 @@ class EnhancedLogger:
                 instance default.
             truncate_length: Maximum length for log messages before truncation.
                 If None, uses the instance default.
+            json_indent: Indentation width for JSON formatted args. Defaults to
+                None (compact single-line JSON).
+
+        Raises:
+            TypeError: If the level is enabled and user_context is not a dict or
+                truncate_length is not an int.
         """
-        formatted_message = self._format_message(
-            message, args, user_context, json_format, truncate, truncate_length
+        if not self._isEnabledFor(_INFO):
+            return
+        message = self._make_message(
+            message,
+            args,
+            user_context,
+            json_format,
+            truncate,
+            truncate_length,
+            json_indent,
         )
-        self.logger.info(formatted_message, stacklevel=2)
+        self._info_fn(message, stacklevel=2)
 
     def warning(
         self,
@@ -530,6 +1434,7 @@ class EnhancedLogger:
         json_format: bool = False,
         truncate: bool = None,
         truncate_length: int = None,
+        json_indent: Optional[int] = None,
     ) -> None:
         """Log a warning message.
 
@@ -544,11 +1449,25 @@ class EnhancedLogger:
                 instance default.
             truncate_length: Maximum length for log messages before truncation.
                 If None, uses the instance default.
+            json_indent: Indentation width for JSON formatted args. Defaults to
+                None (compact single-line JSON).
+
+        Raises:
+            TypeError: If the level is enabled and user_context is not a dict or
+                truncate_length is not an int.
         """
-        formatted_message = self._format_message(
-            message, args, user_context, json_format, truncate, truncate_length
+        if not self._isEnabledFor(_WARNING):
+            return
+        message = self._make_message(
+            message,
+            args,
+            user_context,
+            json_format,
+            truncate,
+            truncate_length,
+            json_indent,
         )
-        self.logger.warning(formatted_message, stacklevel=2)
+        self._warning_fn(message, stacklevel=2)
 
     def error(
         self,
@@ -558,6 +1477,7 @@ class EnhancedLogger:
         json_format: bool = False,
         truncate: bool = None,
         truncate_length: int = None,
+        json_indent: Optional[int] = None,
     ) -> None:
         """Log an error message.
 
@@ -572,11 +1492,25 @@ class EnhancedLogger:
                 instance default.
             truncate_length: Maximum length for log messages before truncation.
                 If None, uses the instance default.
+            json_indent: Indentation width for JSON formatted args. Defaults to
+                None (compact single-line JSON).
+
+        Raises:
+            TypeError: If the level is enabled and user_context is not a dict or
+                truncate_length is not an int.
         """
-        formatted_message = self._format_message(
-            message, args, user_context, json_format, truncate, truncate_length
+        if not self._isEnabledFor(_ERROR):
+            return
+        message = self._make_message(
+            message,
+            args,
+            user_context,
+            json_format,
+            truncate,
+            truncate_length,
+            json_indent,
         )
-        self.logger.error(formatted_message, stacklevel=2)
+        self._error_fn(message, stacklevel=2)
 
     def critical(
         self,
@@ -586,6 +1520,7 @@ class EnhancedLogger:
         json_format: bool = False,
         truncate: bool = None,
         truncate_length: int = None,
+        json_indent: Optional[int] = None,
     ) -> None:
         """Log a critical message.
 
@@ -600,11 +1535,25 @@ class EnhancedLogger:
                 instance default.
             truncate_length: Maximum length for log messages before truncation.
                 If None, uses the instance default.
+            json_indent: Indentation width for JSON formatted args. Defaults to
+                None (compact single-line JSON).
+
+        Raises:
+            TypeError: If the level is enabled and user_context is not a dict or
+                truncate_length is not an int.
         """
-        formatted_message = self._format_message(
-            message, args, user_context, json_format, truncate, truncate_length
+        if not self._isEnabledFor(_CRITICAL):
+            return
+        message = self._make_message(
+            message,
+            args,
+            user_context,
+            json_format,
+            truncate,
+            truncate_length,
+            json_indent,
         )
-        self.logger.critical(formatted_message, stacklevel=2)
+        self._critical_fn(message, stacklevel=2)
 
     def get_logger(self) -> logging.Logger:
         """Get the underlying logger instance.
@@ -655,6 +1604,8 @@ def get_logger(
     use_colors: bool = True,
     timezone: str = None,
     propagate: bool = False,
+    async_file: bool = False,
+    buffer_file: bool = False,
 ) -> EnhancedLogger:
     """Get or create the singleton EnhancedLogger instance.
 
@@ -679,6 +1630,10 @@ def get_logger(
         propagate: Whether to propagate log records to the root logger.
             Set to True for pytest --log-cli-level compatibility.
             Default is False.
+        async_file: Whether to write file output from a background thread
+            through a queue, batching writes. Default is False.
+        buffer_file: Whether to buffer file output in memory and only flush
+            on ERROR and above, flush(), or exit. Default is False.
     Returns:
         The singleton EnhancedLogger instance.
     """
@@ -697,6 +1652,8 @@ def get_logger(
             fileout_path=fileout_path,
             timezone=timezone,
             propagate=propagate,
+            async_file=async_file,
+            buffer_file=buffer_file,
         )
     else:
         # Subsequent calls: reconfigure if parameters are provided
@@ -711,17 +1668,22 @@ def get_logger(
             fileout_path=fileout_path,
             timezone=timezone,
             propagate=propagate,
+            async_file=async_file,
+            buffer_file=buffer_file,
         )
 
     return _logger_instance
 
 
-def get_available_timezones() -> Set[str]:
+@functools.lru_cache(maxsize=1)
+def get_available_timezones() -> FrozenSet[str]:
     """Get all available IANA timezone identifiers.
 
+    The tzdata scan runs once; later calls return the same frozenset.
+
     Returns:
-        A set of all available IANA timezone strings that can be used with the
-        timezone parameter.
+        A frozenset of all available IANA timezone strings that can be used with
+        the timezone parameter.
 
     Example:
         ```python
@@ -736,7 +1698,7 @@ def get_available_timezones() -> Set[str]:
             logger = get_logger(timezone="America/New_York")
         ```
     """
-    return available_timezones()
+    return frozenset(available_timezones())
 
 
 def is_valid_timezone(timezone_str: str) -> bool:
@@ -758,5 +1720,8 @@ def is_valid_timezone(timezone_str: str) -> bool:
             print("Invalid timezone")
         ```
     """
-    return timezone_str in available_timezones()
+    if not timezone_str:
+        # Skip loading the timezone set for empty input.
+        return False
+    return timezone_str in get_available_timezones()
 
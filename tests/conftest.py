@@ -1,7 +1,44 @@
 """Pytest configuration and shared fixtures."""
 
 import os
+import shutil
 import sys
 
+import pytest
+
 # Add src directory to path for imports.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Memory-backed filesystem used for test temp files when available.
+_TMPFS_DIR = "/dev/shm"
+
+# Base temp directory this run created on tmpfs, removed when the run ends.
+_TMPFS_BASETEMP = pytest.StashKey[str]()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Put pytest's temporary directories on tmpfs when it is available.
+
+    The file output tests write many small log files; on tmpfs those writes
+    stay in memory instead of reaching the disk. An explicit `--basetemp` is
+    kept, and `LOGGIO_TEST_TMPFS=0` turns this off.
+    """
+    if config.option.basetemp is not None:
+        return
+    if os.environ.get("LOGGIO_TEST_TMPFS", "1") == "0":
+        return
+    if not (os.path.isdir(_TMPFS_DIR) and os.access(_TMPFS_DIR, os.W_OK)):
+        return
+    # pytest empties an explicit base directory on start, so give each run its
+    # own instead of sharing one between concurrent runs.
+    basetemp = os.path.join(_TMPFS_DIR, f"pytest-loggio-{os.getuid()}-{os.getpid()}")
+    config.option.basetemp = basetemp
+    config.stash[_TMPFS_BASETEMP] = basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the tmpfs base directory, which pytest keeps after the run."""
+    basetemp = config.stash.get(_TMPFS_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
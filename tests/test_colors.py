@@ -0,0 +1,48 @@
+"""Tests for the Colors ANSI escape code constants.
+
+These only read class constants, so they live apart from the logger tests and
+their per-test singleton reset.
+"""
+
+import pytest
+
+from loggio.enhanced_logger import Colors
+
+
+@pytest.mark.parametrize(
+    "attr,code",
+    [
+        ("RESET", "\033[0m"),
+        ("BOLD", "\033[1m"),
+        # Basic foreground colors.
+        ("BLACK", "\033[30m"),
+        ("RED", "\033[31m"),
+        ("GREEN", "\033[32m"),
+        ("YELLOW", "\033[33m"),
+        ("BLUE", "\033[34m"),
+        ("MAGENTA", "\033[35m"),
+        ("CYAN", "\033[36m"),
+        ("WHITE", "\033[37m"),
+        # Bright foreground colors.
+        ("BRIGHT_BLACK", "\033[90m"),
+        ("BRIGHT_RED", "\033[91m"),
+        ("BRIGHT_GREEN", "\033[92m"),
+        ("BRIGHT_YELLOW", "\033[93m"),
+        ("BRIGHT_BLUE", "\033[94m"),
+        ("BRIGHT_MAGENTA", "\033[95m"),
+        ("BRIGHT_CYAN", "\033[96m"),
+        ("BRIGHT_WHITE", "\033[97m"),
+        # Background colors.
+        ("BG_BLACK", "\033[40m"),
+        ("BG_RED", "\033[41m"),
+        ("BG_GREEN", "\033[42m"),
+        ("BG_YELLOW", "\033[43m"),
+        ("BG_BLUE", "\033[44m"),
+        ("BG_MAGENTA", "\033[45m"),
+        ("BG_CYAN", "\033[46m"),
+        ("BG_WHITE", "\033[47m"),
+    ],
+)
+def test_color_code(attr, code):
+    """Test each color constant maps to its ANSI escape code."""
+    assert getattr(Colors, attr) == code
@@ -1,101 +1,235 @@
 """Comprehensive test suite for enhanced_logger module."""
 
+import contextlib
+import copy
+import dataclasses
+import enum
 import json
 import logging
 import os
-import tempfile
+import re
+import subprocess
+import sys
+import threading
 from datetime import datetime
-from io import StringIO
-from unittest.mock import MagicMock, patch
+from io import FileIO, StringIO
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 import pytest
 
+from loggio import enhanced_logger as _el
 from loggio.enhanced_logger import (
     ColoredFormatter,
     Colors,
     EnhancedLogger,
+    _FastLogger,
+    _get_zone,
     get_available_timezones,
     get_logger,
     is_valid_timezone,
 )
 
+# Timezones shared by the formatter tests, parsed once at import.
+_TZ_NY = ZoneInfo("America/New_York")
+_TZ_LONDON = ZoneInfo("Europe/London")
+_TZ_TOKYO = ZoneInfo("Asia/Tokyo")
+
+# Timestamp patterns for log file assertions, compiled once at import.
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2}")
+
+
+class _Color(enum.Enum):
+    """Enum argument for the JSON backend comparison tests."""
+
+    RED = "red"
+
+
+@dataclasses.dataclass
+class _Point:
+    """Dataclass argument for the JSON backend comparison tests."""
+
+    x: int
+    y: int
+
 
 # Fixtures for test setup and teardown.
 @pytest.fixture(autouse=True)
 def reset_singleton():
-    """Reset the EnhancedLogger singleton before each test."""
-    # Reset singleton state before test.
-    EnhancedLogger._instance = None
-    EnhancedLogger._initialized = False
-
+    """Reset the shared get_logger() instance before each test."""
     # Reset global logger instance.
-    import loggio.enhanced_logger
-
-    loggio.enhanced_logger._logger_instance = None
+    _el._logger_instance = None
 
     yield
 
     # Cleanup after test.
-    EnhancedLogger._instance = None
-    EnhancedLogger._initialized = False
-    loggio.enhanced_logger._logger_instance = None
+    _el._logger_instance = None
+
+
+def _installed(logger):
+    """Return the handlers an EnhancedLogger installed on its logger.
+
+    pytest attaches its own capture handlers to non-propagating loggers while
+    a test runs; EnhancedLogger leaves those alone, so tests ignore them too.
+    """
+    return [
+        handler
+        for handler in logger.logger.handlers
+        if getattr(handler, _el._HANDLER_TAG, False)
+    ]
+
+
+def _contains(path, needle: bytes) -> bool:
+    """Check whether a file's raw bytes contain needle, without decoding."""
+    return needle in Path(path).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def all_tz():
+    """Get the available timezones once for the whole session."""
+    return get_available_timezones()
+
+
+@pytest.fixture(scope="module")
+def record_factory():
+    """Return a factory that clones one prototype LogRecord per call.
+
+    Building a LogRecord looks up the thread, process and time; copying the
+    prototype and setting the fields a test cares about skips that work.
+    """
+    prototype = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+
+    def make_record(level=logging.INFO, lineno=1, msg="test message"):
+        record = copy.copy(prototype)
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+        record.lineno = lineno
+        record.msg = msg
+        return record
+
+    return make_record
+
+
+@pytest.fixture(scope="class")
+def fmt_logger():
+    """Create one handler-less logger shared by a class's formatting tests."""
+    return EnhancedLogger(name="fmt_test", terminal=False, fileout_path=None)
+
+
+@pytest.fixture(scope="class")
+def reconf_logger():
+    """Create one handler-less logger shared by a class's reconfigure tests."""
+    return EnhancedLogger(name="reconf_test", terminal=False, fileout_path=None)
+
+
+@pytest.fixture
+def file_logger(temp_log_file):
+    """Create an INFO logger writing only to a fresh log file.
+
+    The file handler is closed on teardown, so each test releases its file.
+    """
+    logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=temp_log_file)
+    yield logger
+    for handler in _installed(logger):
+        logger.logger.removeHandler(handler)
+        handler.close()
 
 
 @pytest.fixture
-def temp_log_file():
-    """Create a temporary log file for testing file output."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
-        temp_path = f.name
-    yield temp_path
-    # Cleanup.
-    if os.path.exists(temp_path):
-        os.remove(temp_path)
-
-
-class TestColors:
-    """Tests for the Colors class constants."""
-
-    def test_reset_color(self):
-        """Test RESET color code exists."""
-        assert Colors.RESET == "\033[0m"
-
-    def test_bold_color(self):
-        """Test BOLD color code exists."""
-        assert Colors.BOLD == "\033[1m"
-
-    def test_basic_colors(self):
-        """Test basic foreground colors exist."""
-        assert Colors.BLACK == "\033[30m"
-        assert Colors.RED == "\033[31m"
-        assert Colors.GREEN == "\033[32m"
-        assert Colors.YELLOW == "\033[33m"
-        assert Colors.BLUE == "\033[34m"
-        assert Colors.MAGENTA == "\033[35m"
-        assert Colors.CYAN == "\033[36m"
-        assert Colors.WHITE == "\033[37m"
-
-    def test_bright_colors(self):
-        """Test bright foreground colors exist."""
-        assert Colors.BRIGHT_BLACK == "\033[90m"
-        assert Colors.BRIGHT_RED == "\033[91m"
-        assert Colors.BRIGHT_GREEN == "\033[92m"
-        assert Colors.BRIGHT_YELLOW == "\033[93m"
-        assert Colors.BRIGHT_BLUE == "\033[94m"
-        assert Colors.BRIGHT_MAGENTA == "\033[95m"
-        assert Colors.BRIGHT_CYAN == "\033[96m"
-        assert Colors.BRIGHT_WHITE == "\033[97m"
-
-    def test_background_colors(self):
-        """Test background colors exist."""
-        assert Colors.BG_BLACK == "\033[40m"
-        assert Colors.BG_RED == "\033[41m"
-        assert Colors.BG_GREEN == "\033[42m"
-        assert Colors.BG_YELLOW == "\033[43m"
-        assert Colors.BG_BLUE == "\033[44m"
-        assert Colors.BG_MAGENTA == "\033[45m"
-        assert Colors.BG_CYAN == "\033[46m"
-        assert Colors.BG_WHITE == "\033[47m"
+def stream_logger():
+    """Create an INFO logger writing only to an in-memory stream.
+
+    Yields the logger and the StringIO that receives its formatted records.
+    """
+    buf = StringIO()
+    logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+    handler = logger.add_stream_handler(buf)
+    yield logger, buf
+    logger.logger.removeHandler(handler)
+
+
+@pytest.fixture
+def colored_terminal_logger():
+    """Create an INFO logger writing colored output to stderr."""
+    return EnhancedLogger(
+        level="INFO", terminal=True, fileout_path=None, use_colors=True
+    )
+
+
+@pytest.fixture
+def plain_terminal_logger():
+    """Create an INFO logger writing uncolored output to stderr."""
+    return EnhancedLogger(
+        level="INFO", terminal=True, fileout_path=None, use_colors=False
+    )
+
+
+@pytest.fixture
+def log_sink():
+    """Create an in-memory handler for asserting on logged output.
+
+    Yields the backing StringIO and a StreamHandler writing to it; tests attach
+    the handler to the logger under test.
+    """
+    buf = StringIO()
+    handler = logging.StreamHandler(buf)
+    yield buf, handler
+    handler.close()
+
+
+@pytest.fixture
+def attach_caplog(caplog):
+    """Return a function that attaches caplog's handler to an EnhancedLogger.
+
+    EnhancedLogger does not propagate by default, so caplog only sees its
+    records when the handler is on the logger itself.
+    """
+    attached = []
+
+    def attach(logger):
+        logger.logger.addHandler(caplog.handler)
+        attached.append(logger.logger)
+
+    yield attach
+    for std_logger in attached:
+        std_logger.removeHandler(caplog.handler)
+
+
+@pytest.fixture(scope="session")
+def log_dir(tmp_path_factory):
+    """Create one directory for all log files in the session."""
+    return tmp_path_factory.mktemp("logs")
+
+
+@pytest.fixture(scope="session")
+def shared_log_path(log_dir):
+    """Return one log file path shared by tests that only inspect handlers.
+
+    Tests that read the file back use temp_log_file instead.
+    """
+    return str(log_dir / "shared.log")
+
+
+@pytest.fixture
+def temp_log_file(log_dir):
+    """Return a fresh log file path for testing file output.
+
+    The file is not created up front; the file handler creates it on open and
+    pytest removes the directory with the rest of its temporary files.
+    """
+    return str(log_dir / f"{uuid4().hex}.log")
 
 
 class TestColoredFormatter:
@@ -119,9 +253,8 @@ class TestColoredFormatter:
 
     def test_init_with_timezone_zoneinfo(self):
         """Test ColoredFormatter initialization with ZoneInfo object."""
-        tz = ZoneInfo("America/New_York")
-        formatter = ColoredFormatter(timezone=tz)
-        assert formatter.timezone == tz
+        formatter = ColoredFormatter(timezone=_TZ_NY)
+        assert formatter.timezone == _TZ_NY
 
     def test_converter_with_string_timezone(self):
         """Test converter method with string timezone."""
@@ -134,12 +267,44 @@ class TestColoredFormatter:
 
     def test_converter_with_zoneinfo_timezone(self):
         """Test converter method with ZoneInfo timezone."""
-        tz = ZoneInfo("Europe/London")
-        formatter = ColoredFormatter(timezone=tz)
+        formatter = ColoredFormatter(timezone=_TZ_LONDON)
         timestamp = 1702500000
         result = formatter.converter(timestamp)
         assert hasattr(result, "tm_year")
 
+    def test_string_timezone_is_parsed_once(self):
+        """Test that string timezones are resolved through the zone cache."""
+        formatter = ColoredFormatter(timezone="Asia/Tokyo")
+        formatter.converter(1702500000)
+        formatter.converter(1702500001)
+        assert formatter._get_tzinfo() is _get_zone("Asia/Tokyo")
+        if hasattr(_get_zone, "cache_info"):
+            assert _get_zone.cache_info().currsize > 0
+
+    def test_tzinfo_resolved_once_per_timezone(self):
+        """Test the formatter reuses its tzinfo until the timezone changes."""
+        formatter = ColoredFormatter(timezone="Asia/Tokyo")
+        with patch.object(_el, "_get_zone", wraps=_get_zone) as mock_get_zone:
+            formatter.converter(1702500000)
+            formatter.converter(1702500001)
+            assert mock_get_zone.call_count == 1
+            formatter.timezone = "UTC"
+            assert formatter._get_tzinfo() is _get_zone("UTC")
+
+    def test_zone_cache_can_be_disabled(self):
+        """Test LOGGIO_TZ_CACHE=0 resolves zones without the cache."""
+        code = (
+            "from loggio import enhanced_logger as el; "
+            "assert el._get_zone is el._load_zone"
+        )
+        env = dict(os.environ, LOGGIO_TZ_CACHE="0")
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env=env,
+        )
+        assert result.returncode == 0
+
     def test_converter_without_timezone(self):
         """Test converter method without timezone falls back to default."""
         formatter = ColoredFormatter(timezone=None)
@@ -147,67 +312,53 @@ class TestColoredFormatter:
         result = formatter.converter(timestamp)
         assert hasattr(result, "tm_year")
 
-    def test_format_time_with_string_timezone_and_datefmt(self):
+    def test_format_time_with_string_timezone_and_datefmt(self, record_factory):
         """Test formatTime with string timezone and custom date format."""
         formatter = ColoredFormatter(timezone="UTC")
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory()
         result = formatter.formatTime(record, datefmt="%Y-%m-%d %H:%M:%S")
         # Should be formatted string.
         assert "-" in result
         assert ":" in result
 
-    def test_format_time_with_zoneinfo_timezone_no_datefmt(self):
+    def test_format_time_with_zoneinfo_timezone_no_datefmt(self, record_factory):
         """Test formatTime with ZoneInfo timezone and no date format (uses ISO)."""
-        tz = ZoneInfo("Asia/Tokyo")
-        formatter = ColoredFormatter(timezone=tz)
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="test message",
-            args=(),
-            exc_info=None,
-        )
+        formatter = ColoredFormatter(timezone=_TZ_TOKYO)
+        record = record_factory()
         result = formatter.formatTime(record)
         # Should be ISO format.
         assert "T" in result or "-" in result
 
-    def test_format_time_without_timezone(self):
+    @pytest.mark.parametrize(
+        "timezone", [None, "UTC", "America/New_York", "Asia/Kolkata"]
+    )
+    @pytest.mark.parametrize("created", [1702500000.25, 1720000000.75])
+    def test_format_time_default_datefmt_matches_strftime(
+        self, record_factory, timezone, created
+    ):
+        """Test the fast default timestamp matches strftime's rendering."""
+        formatter = ColoredFormatter(timezone=timezone)
+        record = record_factory()
+        record.created = created
+        if timezone is None:
+            expected = datetime.fromtimestamp(created).astimezone()
+        else:
+            expected = datetime.fromtimestamp(created, tz=ZoneInfo(timezone))
+        assert formatter.formatTime(record, _el._DATE_FORMAT) == (
+            expected.strftime(_el._DATE_FORMAT)
+        )
+
+    def test_format_time_without_timezone(self, record_factory):
         """Test formatTime without timezone falls back to default."""
         formatter = ColoredFormatter(timezone=None)
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory()
         result = formatter.formatTime(record)
         assert result is not None
 
-    def test_format_time_with_invalid_timezone(self, capsys):
+    def test_format_time_with_invalid_timezone(self, record_factory, capsys):
         """Test formatTime with invalid timezone falls back to local time."""
         formatter = ColoredFormatter(timezone="Invalid/Timezone")
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=1,
-            msg="test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory()
         result = formatter.formatTime(record)
         captured = capsys.readouterr()
         # Should print warning to stderr.
@@ -215,85 +366,92 @@ class TestColoredFormatter:
         # Timezone should be reset to None.
         assert formatter.timezone is None
 
-    def test_format_with_colors_enabled(self):
+    def test_format_with_colors_enabled(self, record_factory):
         """Test format method with colors enabled."""
         fmt = "%(levelname)s:[%(asctime)s]%(filename)s:%(lineno)d:%(message)s"
         formatter = ColoredFormatter(fmt=fmt, use_colors=True)
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=42,
-            msg="test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory(lineno=42)
         result = formatter.format(record)
         # Should contain color codes.
         assert "\033[" in result
 
-    def test_format_with_colors_disabled(self):
+    def test_format_with_colors_uses_precomputed_format(self, record_factory):
+        """Test colored output comes from the precomputed format string."""
+        fmt = "%(levelname)s:%(filename)s:%(lineno)d:%(message)s"
+        formatter = ColoredFormatter(fmt=fmt, use_colors=True)
+        record = record_factory(lineno=42)
+        result = formatter.format(record)
+        assert result == (
+            f"{Colors.BRIGHT_GREEN}INFO{Colors.RESET}:"
+            f"{Colors.CYAN}test.py:42{Colors.RESET}:test message"
+        )
+        # The base format string is never rewritten.
+        assert formatter._style._fmt == fmt
+
+    def test_format_with_colors_keeps_record_levelname(self, record_factory):
+        """Test colored formatting does not leak ANSI codes into the record."""
+        fmt = "%(levelname)s:%(message)s"
+        colored = ColoredFormatter(fmt=fmt, use_colors=True)
+        plain = ColoredFormatter(fmt=fmt, use_colors=False)
+        record = record_factory(logging.WARNING)
+        assert "\033[" in colored.format(record)
+        assert record.levelname == "WARNING"
+        # A plain handler formatting the same record afterwards stays clean.
+        assert plain.format(record) == "WARNING:test message"
+
+    def test_format_with_colors_disabled(self, record_factory):
         """Test format method with colors disabled."""
         fmt = "%(levelname)s:%(message)s"
         formatter = ColoredFormatter(fmt=fmt, use_colors=False)
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=42,
-            msg="test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory(lineno=42)
         result = formatter.format(record)
         # Should not contain color codes.
         assert "\033[" not in result
         assert "test message" in result
 
-    def test_format_all_log_levels(self):
+    @pytest.mark.parametrize(
+        "level",
+        [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL],
+    )
+    def test_format_all_log_levels(self, record_factory, level):
         """Test format method with all log levels."""
         fmt = "%(levelname)s:%(message)s"
         formatter = ColoredFormatter(fmt=fmt, use_colors=True)
+        record = record_factory(level, msg="test")
+        result = formatter.format(record)
+        # All levels should produce output with color codes.
+        assert "\033[" in result
 
-        levels = [
-            logging.DEBUG,
-            logging.INFO,
-            logging.WARNING,
-            logging.ERROR,
-            logging.CRITICAL,
-        ]
-
-        for level in levels:
-            record = logging.LogRecord(
-                name="test",
-                level=level,
-                pathname="test.py",
-                lineno=1,
-                msg="test",
-                args=(),
-                exc_info=None,
-            )
-            result = formatter.format(record)
-            # All levels should produce output with color codes.
-            assert "\033[" in result
-
-    def test_format_unknown_log_level(self):
+    def test_format_unknown_log_level(self, record_factory):
         """Test format method with an unknown log level."""
         fmt = "%(levelname)s:%(message)s"
         formatter = ColoredFormatter(fmt=fmt, use_colors=True)
-        record = logging.LogRecord(
-            name="test",
-            level=99,  # Unknown level.
-            pathname="test.py",
-            lineno=1,
-            msg="test",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory(99, msg="test")  # Unknown level.
         result = formatter.format(record)
         # Should still produce output.
         assert "test" in result
 
+    @pytest.mark.parametrize(
+        "fmt,style,expected",
+        [
+            ("%(levelname)-8s %(message)s", "%", "{0:<8} test message"),
+            ("%(levelname)s %(message)s", "%", "{0} test message"),
+            ("{levelname} {message}", "{", "{0} test message"),
+            ("{levelname:<8} {message}", "{", "{0:<8} test message"),
+            ("${levelname} $message", "$", "{0} test message"),
+        ],
+    )
+    def test_level_name_colored_in_any_format(
+        self, record_factory, fmt, style, expected
+    ):
+        """Test padded and non-% level name fields are still colored."""
+        formatter = ColoredFormatter(fmt=fmt, style=style, use_colors=True)
+        record = record_factory(level=logging.ERROR)
+        colored = f"{Colors.BRIGHT_RED}ERROR{Colors.RESET}"
+        assert formatter.format(record) == expected.format(colored)
+        # The record itself keeps its plain level name for other handlers.
+        assert record.levelname == "ERROR"
+
     def test_level_colors_mapping(self):
         """Test that LEVEL_COLORS mapping contains expected levels."""
         assert logging.DEBUG in ColoredFormatter.LEVEL_COLORS
@@ -302,27 +460,61 @@ class TestColoredFormatter:
         assert logging.ERROR in ColoredFormatter.LEVEL_COLORS
         assert logging.CRITICAL in ColoredFormatter.LEVEL_COLORS
 
+    def test_precolored_level_names(self):
+        """Test that colored level names are precomputed for every level."""
+        precolored = ColoredFormatter._PRECOLORED
+        assert precolored.keys() == ColoredFormatter.LEVEL_COLORS.keys()
+        assert ColoredFormatter._PRECOLORED[logging.ERROR] == (
+            f"{Colors.BRIGHT_RED}ERROR{Colors.RESET}"
+        )
+
+    def test_adjacent_color_codes_are_merged(self, record_factory):
+        """Test that back-to-back color codes are written as one sequence."""
+        assert ColoredFormatter._PRECOLORED[logging.CRITICAL] == (
+            f"\033[41;37;1mCRITICAL{Colors.RESET}"
+        )
+        formatter = ColoredFormatter(fmt="%(asctime)s%(message)s", use_colors=True)
+        record = record_factory(level=logging.CRITICAL)
+        assert "m\033[" not in formatter.format(record)
+
 
-class TestEnhancedLoggerSingleton:
-    """Tests for EnhancedLogger singleton pattern."""
+class TestEnhancedLoggerInstances:
+    """Tests for EnhancedLogger instance creation."""
 
-    def test_singleton_returns_same_instance(self):
-        """Test that multiple instantiations return the same instance."""
+    def test_instantiation_creates_new_instance(self):
+        """Test that each instantiation returns a new instance."""
         logger1 = EnhancedLogger(name="test1", terminal=False, fileout_path=None)
         logger2 = EnhancedLogger(name="test2", terminal=False, fileout_path=None)
-        assert logger1 is logger2
+        assert logger1 is not logger2
 
-    def test_singleton_initialization_only_once(self):
-        """Test that initialization only happens once."""
-        logger1 = EnhancedLogger(
-            name="first", level="DEBUG", terminal=False, fileout_path=None
-        )
+    def test_instantiation_always_initializes(self):
+        """Test that every instantiation applies its own configuration."""
+        EnhancedLogger(name="first", level="DEBUG", terminal=False, fileout_path=None)
         logger2 = EnhancedLogger(
             name="second", level="WARNING", terminal=False, fileout_path=None
         )
-        # Second call should not reinitialize.
-        assert logger2.name == "first"
-        assert logger2.level == "DEBUG"
+        assert logger2.name == "second"
+        assert logger2.level == "WARNING"
+        assert logger2.logger.level == logging.WARNING
+
+
+class TestSlots:
+    """Tests for the __slots__ declarations."""
+
+    def test_enhanced_logger_has_no_instance_dict(self):
+        """Test EnhancedLogger stores attributes in slots only."""
+        logger = EnhancedLogger(terminal=False, fileout_path=None)
+        assert not hasattr(logger, "__dict__")
+        with pytest.raises(AttributeError):
+            logger.not_a_setting = True
+
+    def test_enhanced_logger_settings_remain_assignable(self):
+        """Test that instance-level settings can still be changed directly."""
+        logger = EnhancedLogger(terminal=False, fileout_path=None)
+        logger.truncate_length = 5
+        assert logger._format_message("Hello, world!") == (
+            "Hello... [TRUNCATED, LENGTH: 13]"
+        )
 
 
 class TestEnhancedLoggerInit:
@@ -341,13 +533,13 @@ class TestEnhancedLoggerInit:
         assert logger.use_colors is True
         assert logger.timezone is None
 
-    def test_init_with_custom_parameters(self, temp_log_file):
+    def test_init_with_custom_parameters(self, shared_log_path):
         """Test EnhancedLogger initialization with custom parameters."""
         logger = EnhancedLogger(
             name="custom",
             level="DEBUG",
             terminal=True,
-            fileout_path=temp_log_file,
+            fileout_path=shared_log_path,
             json_format=True,
             truncate_length=1000,
             truncate=False,
@@ -357,32 +549,48 @@ class TestEnhancedLoggerInit:
         assert logger.name == "custom"
         assert logger.level == "DEBUG"
         assert logger.terminal is True
-        assert logger.fileout_path == temp_log_file
+        assert logger.fileout_path == shared_log_path
         assert logger.json_format is True
         assert logger.truncate_length == 1000
         assert logger.truncate is False
         assert logger.use_colors is False
         assert logger.timezone == "UTC"
 
-    def test_init_creates_file_handler(self, temp_log_file):
+    def test_init_creates_file_handler(self, shared_log_path):
         """Test that initialization creates file handler when path provided."""
-        logger = EnhancedLogger(terminal=False, fileout_path=temp_log_file)
+        logger = EnhancedLogger(terminal=False, fileout_path=shared_log_path)
         # Should have one file handler.
-        assert len(logger.logger.handlers) == 1
-        assert isinstance(logger.logger.handlers[0], logging.FileHandler)
+        assert len(_installed(logger)) == 1
+        assert isinstance(_installed(logger)[0], logging.FileHandler)
 
     def test_init_creates_terminal_handler(self):
         """Test that initialization creates terminal handler when enabled."""
         logger = EnhancedLogger(terminal=True, fileout_path=None)
         # Should have one stream handler.
-        assert len(logger.logger.handlers) == 1
-        assert isinstance(logger.logger.handlers[0], logging.StreamHandler)
+        assert len(_installed(logger)) == 1
+        assert isinstance(_installed(logger)[0], logging.StreamHandler)
 
-    def test_init_creates_both_handlers(self, temp_log_file):
+    def test_init_creates_both_handlers(self, shared_log_path):
         """Test that initialization creates both handlers when both enabled."""
-        logger = EnhancedLogger(terminal=True, fileout_path=temp_log_file)
+        logger = EnhancedLogger(terminal=True, fileout_path=shared_log_path)
         # Should have two handlers.
-        assert len(logger.logger.handlers) == 2
+        assert len(_installed(logger)) == 2
+
+    def test_init_replaces_only_own_handlers(self, log_sink):
+        """Test a new instance replaces earlier loggio handlers, not the user's."""
+        _, user_handler = log_sink
+        first = EnhancedLogger(name="shared_handlers", terminal=True, fileout_path=None)
+        first.logger.addHandler(user_handler)
+        (old_handler,) = _installed(first)
+        second = EnhancedLogger(
+            name="shared_handlers", terminal=True, fileout_path=None
+        )
+        try:
+            assert user_handler in second.logger.handlers
+            assert old_handler not in second.logger.handlers
+            assert len(_installed(second)) == 1
+        finally:
+            second.logger.removeHandler(user_handler)
 
     def test_init_sets_propagate_false_by_default(self):
         """Test that logger.propagate is False by default."""
@@ -397,67 +605,146 @@ class TestEnhancedLoggerInit:
         assert logger.logger.propagate is True
 
 
+class TestFastLogger:
+    """Tests for the _FastLogger caller lookup."""
+
+    def test_enhanced_logger_uses_fast_logger(self):
+        """Test that EnhancedLogger creates its logger as a _FastLogger."""
+        logger = EnhancedLogger(
+            name="fast_logger_test", terminal=False, fileout_path=None
+        )
+        assert isinstance(logger.logger, _FastLogger)
+
+    def test_logger_class_is_restored(self):
+        """Test that other loggers keep the configured logger class."""
+        EnhancedLogger(name="fast_logger_restore", terminal=False, fileout_path=None)
+        assert logging.getLoggerClass() is logging.Logger
+        assert not isinstance(logging.getLogger("not_loggio_owned"), _FastLogger)
+
+    def test_global_logger_class_never_swapped(self):
+        """Test the process-wide logger class is left alone, for thread safety."""
+        with patch.object(logging, "setLoggerClass") as mock_set_class:
+            logger = EnhancedLogger(
+                name="fast_logger_no_swap", terminal=False, fileout_path=None
+            )
+        mock_set_class.assert_not_called()
+        assert isinstance(logger.logger, _FastLogger)
+        assert logging.Logger.manager.loggerClass is None
+
+    def test_direct_logger_call_points_at_caller(self):
+        """Test records from the underlying logger point at the caller."""
+        logger = EnhancedLogger(
+            name="fast_logger_direct", terminal=False, fileout_path=None
+        )
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.logger.addHandler(handler)
+        try:
+            logger.logger.warning("Direct call", stack_info=True)
+            expected_lineno = sys._getframe().f_lineno - 1
+        finally:
+            logger.logger.removeHandler(handler)
+        assert records[0].filename == os.path.basename(__file__)
+        assert records[0].lineno == expected_lineno
+        assert records[0].funcName == "test_direct_logger_call_points_at_caller"
+        assert records[0].stack_info.startswith("Stack (most recent call last):")
+
+
 class TestEnhancedLoggerReconfigure:
     """Tests for EnhancedLogger reconfigure method."""
 
-    def test_reconfigure_level(self, temp_log_file):
+    def test_reconfigure_level(self, shared_log_path):
         """Test reconfiguring log level."""
         logger = EnhancedLogger(
-            level="INFO", terminal=False, fileout_path=temp_log_file
+            level="INFO", terminal=False, fileout_path=shared_log_path
         )
         logger.reconfigure(level="DEBUG")
         assert logger.level == "DEBUG"
         assert logger.logger.level == logging.DEBUG
 
-    def test_reconfigure_terminal(self, temp_log_file):
+    def test_reconfigure_terminal(self, shared_log_path):
         """Test reconfiguring terminal output."""
-        logger = EnhancedLogger(terminal=False, fileout_path=temp_log_file)
+        logger = EnhancedLogger(terminal=False, fileout_path=shared_log_path)
         logger.reconfigure(terminal=True)
         assert logger.terminal is True
         # Should now have both handlers.
-        assert len(logger.logger.handlers) == 2
+        assert len(_installed(logger)) == 2
 
-    def test_reconfigure_fileout_path(self, temp_log_file):
+    def test_reconfigure_fileout_path(self, shared_log_path):
         """Test reconfiguring file output path."""
         logger = EnhancedLogger(terminal=False, fileout_path=None)
+        logger.reconfigure(fileout_path=shared_log_path)
+        assert logger.fileout_path == shared_log_path
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("json_format", True),
+            ("truncate_length", 1000),
+            ("truncate", False),
+            ("use_colors", False),
+            ("timezone", "UTC"),
+            ("propagate", True),
+            ("name", "new"),
+        ],
+    )
+    def test_reconfigure_single_field(self, reconf_logger, field, value):
+        """Test reconfiguring one setting updates that attribute."""
+        reconf_logger.reconfigure(**{field: value})
+        assert getattr(reconf_logger, field) == value
+
+    def test_reconfigure_keeps_handlers_when_unchanged(self, shared_log_path):
+        """Test reconfigure reuses handlers when their options are unchanged."""
+        logger = EnhancedLogger(terminal=True, fileout_path=shared_log_path)
+        handlers = list(_installed(logger))
+        logger.reconfigure(level="DEBUG", truncate_length=100)
+        assert _installed(logger) == handlers
+
+    def test_reconfigure_rebuilds_and_closes_changed_handlers(
+        self, shared_log_path, temp_log_file
+    ):
+        """Test reconfigure replaces handlers and closes the old file handler."""
+        logger = EnhancedLogger(terminal=False, fileout_path=shared_log_path)
+        old_file_handler = _installed(logger)[0]
         logger.reconfigure(fileout_path=temp_log_file)
-        assert logger.fileout_path == temp_log_file
-
-    def test_reconfigure_json_format(self):
-        """Test reconfiguring JSON format."""
-        logger = EnhancedLogger(json_format=False, terminal=False, fileout_path=None)
-        logger.reconfigure(json_format=True)
-        assert logger.json_format is True
-
-    def test_reconfigure_truncate_length(self):
-        """Test reconfiguring truncate length."""
-        logger = EnhancedLogger(truncate_length=5000, terminal=False, fileout_path=None)
-        logger.reconfigure(truncate_length=1000)
-        assert logger.truncate_length == 1000
+        assert _installed(logger)[0] is not old_file_handler
+        assert old_file_handler.stream is None
 
-    def test_reconfigure_truncate(self):
-        """Test reconfiguring truncate setting."""
-        logger = EnhancedLogger(truncate=True, terminal=False, fileout_path=None)
-        logger.reconfigure(truncate=False)
-        assert logger.truncate is False
-
-    def test_reconfigure_use_colors(self):
-        """Test reconfiguring use_colors setting."""
-        logger = EnhancedLogger(use_colors=True, terminal=False, fileout_path=None)
-        logger.reconfigure(use_colors=False)
-        assert logger.use_colors is False
-
-    def test_reconfigure_timezone(self):
-        """Test reconfiguring timezone setting."""
-        logger = EnhancedLogger(timezone=None, terminal=False, fileout_path=None)
+    def test_reconfigure_timezone_keeps_handlers(self, shared_log_path):
+        """Test reconfiguring the timezone swaps it on the existing formatters."""
+        logger = EnhancedLogger(terminal=True, fileout_path=shared_log_path)
+        handlers = list(_installed(logger))
         logger.reconfigure(timezone="UTC")
-        assert logger.timezone == "UTC"
-
-    def test_reconfigure_name(self):
-        """Test reconfiguring name setting."""
-        logger = EnhancedLogger(name="old", terminal=False, fileout_path=None)
-        logger.reconfigure(name="new")
-        assert logger.name == "new"
+        assert _installed(logger) == handlers
+        for handler in handlers:
+            assert handler.formatter.timezone == "UTC"
+
+    def test_reconfigure_terminal_keeps_file_handler(self, shared_log_path):
+        """Test changing terminal options keeps the open file handler."""
+        logger = EnhancedLogger(terminal=True, fileout_path=shared_log_path)
+        file_handler, terminal_handler = _installed(logger)
+        logger.reconfigure(use_colors=False)
+        assert _installed(logger)[0] is file_handler
+        assert _installed(logger)[1] is not terminal_handler
+        assert file_handler.stream is not None
+        logger.reconfigure(terminal=False)
+        assert _installed(logger) == [file_handler]
+
+    def test_reconfigure_file_keeps_terminal_handler(self, shared_log_path):
+        """Test changing file options keeps the terminal handler."""
+        logger = EnhancedLogger(terminal=True, fileout_path=None)
+        (terminal_handler,) = _installed(logger)
+        logger.reconfigure(fileout_path=shared_log_path)
+        assert isinstance(_installed(logger)[0], logging.FileHandler)
+        assert _installed(logger)[1] is terminal_handler
+
+    def test_reconfigure_level_resets_changed_logger_level(self):
+        """Test reconfigure sets the level even if it matches the cached one."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        logger.logger.setLevel(logging.ERROR)
+        logger.reconfigure(level="INFO")
+        assert logger.get_level() == logging.INFO
 
     def test_reconfigure_preserves_unset_parameters(self):
         """Test that reconfigure preserves parameters not explicitly set."""
@@ -478,44 +765,84 @@ class TestEnhancedLoggerReconfigure:
 class TestEnhancedLoggerFormatMessage:
     """Tests for EnhancedLogger _format_message method."""
 
-    def test_format_simple_message(self):
+    @pytest.fixture(autouse=True)
+    def restore_truncation(self, fmt_logger):
+        """Restore the shared logger's truncation defaults after each test."""
+        yield
+        fmt_logger.reconfigure(truncate=True, truncate_length=5000)
+
+    def test_format_simple_message(self, fmt_logger):
         """Test formatting a simple message without args."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
-        result = logger._format_message("Hello World")
+        result = fmt_logger._format_message("Hello World")
         assert result == "Hello World"
 
-    def test_format_message_with_args(self):
+    def test_format_plain_message_skips_substitution(self, fmt_logger):
+        """Test a message without args is not %-formatted."""
+        result = fmt_logger._format_message("100% done", json_format=True)
+        assert result == "100% done"
+
+    def test_format_message_with_args(self, fmt_logger):
         """Test formatting message with format string args."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
-        result = logger._format_message("Value: %s, Count: %d", ("test", 42))
+        result = fmt_logger._format_message("Value: %s, Count: %d", ("test", 42))
         assert result == "Value: test, Count: 42"
 
-    def test_format_message_with_user_context(self):
+    def test_format_message_with_user_context(self, fmt_logger):
         """Test formatting message with user context."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
         user_context = {"uid": "user123", "email": "test@example.com"}
-        result = logger._format_message("Action completed", user_context=user_context)
+        result = fmt_logger._format_message(
+            "Action completed", user_context=user_context
+        )
         assert result == "user123: Action completed"
 
-    def test_format_message_user_context_without_uid(self):
+    def test_format_message_user_context_without_uid(self, fmt_logger):
         """Test formatting message with user context without uid key."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
         user_context = {"email": "test@example.com"}
-        result = logger._format_message("Action completed", user_context=user_context)
+        result = fmt_logger._format_message(
+            "Action completed", user_context=user_context
+        )
         # Should not prepend anything since no uid.
         assert result == "Action completed"
 
-    def test_format_message_with_json_format(self):
+    def test_format_message_user_context_with_none_uid(self, fmt_logger):
+        """Test formatting message with a uid explicitly set to None."""
+        result = fmt_logger._format_message(
+            "Action completed", user_context={"uid": None}
+        )
+        assert result == "Action completed"
+
+    def test_format_message_with_json_format(self, fmt_logger):
         """Test formatting message with JSON format enabled."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
         data = {"key": "value", "nested": {"inner": 123}}
-        result = logger._format_message("Data: %s", (data,), json_format=True)
-        assert '"key": "value"' in result
-        assert '"nested"' in result
+        result = fmt_logger._format_message("Data: %s", (data,), json_format=True)
+        # Compact single-line JSON by default.
+        assert result == 'Data: {"key":"value","nested":{"inner":123}}'
 
-    def test_format_message_json_format_error(self):
+    def test_format_message_with_json_indent(self, fmt_logger):
+        """Test formatting message with indented JSON output."""
+        data = {"key": "value", "nested": {"inner": 123}}
+        result = fmt_logger._format_message(
+            "Data: %s", (data,), json_format=True, json_indent=4
+        )
+        assert result == f"Data: {json.dumps(data, indent=4)}"
+
+    def test_format_message_json_format_scalars_pass_through(self, fmt_logger):
+        """Test JSON formatting passes str, int and float args through."""
+        with patch.object(_el, "_json_dumps") as mock_dumps:
+            result = fmt_logger._format_message(
+                "%s has %d items at %.1f", ("cart", 3, 9.5), json_format=True
+            )
+        assert result == "cart has 3 items at 9.5"
+        mock_dumps.assert_not_called()
+
+    def test_format_message_json_format_bool_and_none(self, fmt_logger):
+        """Test JSON formatting still renders bool and None as JSON."""
+        result = fmt_logger._format_message(
+            "Flags: %s %s", (True, None), json_format=True
+        )
+        assert result == "Flags: true null"
+
+    def test_format_message_json_format_error(self, fmt_logger):
         """Test formatting message when JSON formatting fails."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
 
         # Create an object that can't be easily JSON serialized.
         class NonSerializable:
@@ -523,196 +850,367 @@ class TestEnhancedLoggerFormatMessage:
 
         obj = NonSerializable()
         # The default=str in json.dumps should handle this.
-        result = logger._format_message("Data: %s", (obj,), json_format=True)
+        result = fmt_logger._format_message("Data: %s", (obj,), json_format=True)
         assert "Data:" in result
 
-    def test_format_message_json_format_exception(self):
+    def test_format_message_json_format_exception(self, fmt_logger):
         """Test formatting message when json.dumps raises an exception."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
         data = {"key": "value"}
 
-        # Mock json.dumps to raise a TypeError.
-        with patch(
-            "loggio.enhanced_logger.json.dumps", side_effect=TypeError("Mock JSON error")
-        ):
-            result = logger._format_message("Data: %s", (data,), json_format=True)
+        # Mock the JSON serializer to raise a TypeError.
+        with patch.object(_el, "_json_dumps", side_effect=TypeError("Mock JSON error")):
+            result = fmt_logger._format_message("Data: %s", (data,), json_format=True)
             assert "JSON FORMAT ERROR" in result
             assert "Mock JSON error" in result
 
-    def test_format_message_json_format_value_error(self):
+    def test_format_message_json_format_value_error(self, fmt_logger):
         """Test formatting message when json.dumps raises ValueError."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
         data = {"key": "value"}
 
-        # Mock json.dumps to raise a ValueError.
-        with patch(
-            "loggio.enhanced_logger.json.dumps",
-            side_effect=ValueError("Value error in JSON"),
+        # Mock the JSON serializer to raise a ValueError.
+        with patch.object(
+            _el, "_json_dumps", side_effect=ValueError("Value error in JSON")
         ):
-            result = logger._format_message("Data: %s", (data,), json_format=True)
+            result = fmt_logger._format_message("Data: %s", (data,), json_format=True)
             assert "JSON FORMAT ERROR" in result
             assert "Value error in JSON" in result
 
-    def test_format_message_format_string_error(self):
+    def test_format_message_json_format_orjson(self, fmt_logger):
+        """Test JSON formatting uses orjson when it is installed."""
+        orjson = pytest.importorskip("orjson")
+        data = {"key": "value", 1: "int key"}
+        result = fmt_logger._format_message(
+            "Data: %s", (data,), json_format=True, json_indent=2
+        )
+        expected = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        assert result == f"Data: {expected}"
+
+    def test_format_message_json_format_orjson_fallback(self, fmt_logger):
+        """Test JSON formatting falls back to json for input orjson rejects."""
+        pytest.importorskip("orjson")
+        data = {"big": 2**70}
+        result = fmt_logger._format_message("Data: %s", (data,), json_format=True)
+        assert result == 'Data: {"big":1180591620717411303424}'
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"n": "café", "emoji": "😀"},
+            {"when": datetime(2024, 1, 1)},
+            {"color": _Color.RED},
+            {"point": _Point(1, 2)},
+            {1: "int key", "nested": [1, {"a": None, "b": True}]},
+        ],
+    )
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_json_backends_render_alike(self, payload, indent):
+        """Test orjson and the stdlib json module produce the same output."""
+        assert _el._json_dumps(payload, indent) == (
+            _el._stdlib_json_dumps(payload, indent)
+        )
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_json_backends_parse_floats_alike(self, indent):
+        """Test both backends' float output parses to the same values."""
+        payload = {"big": 1e20, "small": 2.5e-5, "plain": 1.5, "neg": -1e-7}
+        assert json.loads(_el._json_dumps(payload, indent)) == payload
+        assert json.loads(_el._stdlib_json_dumps(payload, indent)) == payload
+
+    def test_format_message_format_string_error(self, fmt_logger):
         """Test formatting message when format string fails."""
-        logger = EnhancedLogger(terminal=False, fileout_path=None)
         # Mismatched format specifiers.
-        result = logger._format_message("Value: %d", ("not_a_number",))
+        result = fmt_logger._format_message("Value: %d", ("not_a_number",))
         assert "FORMAT ERROR" in result
         assert "not_a_number" in result
 
-    def test_format_message_truncation_enabled(self):
+    def test_format_message_truncation_enabled(self, fmt_logger):
         """Test formatting message with truncation enabled."""
-        logger = EnhancedLogger(
-            truncate=True, truncate_length=20, terminal=False, fileout_path=None
-        )
+        fmt_logger.reconfigure(truncate=True, truncate_length=20)
         long_message = "A" * 100
-        result = logger._format_message(long_message)
+        result = fmt_logger._format_message(long_message)
         assert "TRUNCATED" in result
         assert len(result) < 100 + 50  # Allow for truncation message.
 
-    def test_format_message_truncation_disabled(self):
+    def test_format_message_truncation_disabled(self, fmt_logger):
         """Test formatting message with truncation disabled."""
-        logger = EnhancedLogger(
-            truncate=False, truncate_length=20, terminal=False, fileout_path=None
-        )
+        fmt_logger.reconfigure(truncate=False, truncate_length=20)
         long_message = "A" * 100
-        result = logger._format_message(long_message)
+        result = fmt_logger._format_message(long_message)
         assert "TRUNCATED" not in result
         assert result == long_message
 
-    def test_format_message_truncation_override(self):
+    def test_format_message_truncation_override(self, fmt_logger):
         """Test formatting message with truncation parameter override."""
-        logger = EnhancedLogger(
-            truncate=True, truncate_length=5000, terminal=False, fileout_path=None
-        )
+        fmt_logger.reconfigure(truncate=True, truncate_length=5000)
         long_message = "A" * 100
         # Override with function parameter.
-        result = logger._format_message(long_message, truncate=False)
+        result = fmt_logger._format_message(long_message, truncate=False)
         assert "TRUNCATED" not in result
 
-    def test_format_message_truncate_length_override(self):
+    def test_format_message_truncate_length_override(self, fmt_logger):
         """Test formatting message with truncate_length parameter override."""
-        logger = EnhancedLogger(
-            truncate=True, truncate_length=5000, terminal=False, fileout_path=None
-        )
+        fmt_logger.reconfigure(truncate=True, truncate_length=5000)
         long_message = "A" * 100
         # Override with function parameter.
-        result = logger._format_message(long_message, truncate_length=10)
+        result = fmt_logger._format_message(long_message, truncate_length=10)
         assert "TRUNCATED" in result
 
+    def test_format_message_truncation_output(self, fmt_logger):
+        """Test the exact truncated message layout."""
+        result = fmt_logger._format_message("A" * 30, truncate_length=10)
+        assert result == "AAAAAAAAAA... [TRUNCATED, LENGTH: 30]"
+
 
 class TestEnhancedLoggerLoggingMethods:
     """Tests for EnhancedLogger logging methods."""
 
-    def test_debug_method(self, temp_log_file):
+    def test_debug_method(self, caplog, attach_caplog):
         """Test debug logging method."""
-        logger = EnhancedLogger(
-            level="DEBUG", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="DEBUG", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.debug("Debug message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "Debug message" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Debug message"
 
-    def test_info_method(self, temp_log_file):
+    def test_info_method(self, caplog, attach_caplog):
         """Test info logging method."""
-        logger = EnhancedLogger(
-            level="INFO", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.info("Info message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "Info message" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Info message"
 
-    def test_warning_method(self, temp_log_file):
+    def test_warning_method(self, caplog, attach_caplog):
         """Test warning logging method."""
-        logger = EnhancedLogger(
-            level="WARNING", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="WARNING", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.warning("Warning message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "Warning message" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Warning message"
 
-    def test_error_method(self, temp_log_file):
+    def test_error_method(self, caplog, attach_caplog):
         """Test error logging method."""
-        logger = EnhancedLogger(
-            level="ERROR", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="ERROR", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.error("Error message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "Error message" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Error message"
 
-    def test_critical_method(self, temp_log_file):
+    def test_critical_method(self, caplog, attach_caplog):
         """Test critical logging method."""
-        logger = EnhancedLogger(
-            level="CRITICAL", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="CRITICAL", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.critical("Critical message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "Critical message" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Critical message"
 
-    def test_logging_with_format_args(self, temp_log_file):
+    def test_logging_with_format_args(self, caplog, attach_caplog):
         """Test logging with format string arguments."""
-        logger = EnhancedLogger(
-            level="INFO", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.info("Value: %s, Count: %d", "test", 42)
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "Value: test, Count: 42" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Value: test, Count: 42"
 
-    def test_logging_with_user_context(self, temp_log_file):
+    def test_logging_with_user_context(self, caplog, attach_caplog):
         """Test logging with user context."""
-        logger = EnhancedLogger(
-            level="INFO", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        attach_caplog(logger)
         logger.info("Action", user_context={"uid": "user123"})
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "user123: Action" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "user123: Action"
 
-    def test_logging_with_json_format(self, temp_log_file):
+    def test_logging_with_json_format(self, caplog, attach_caplog):
         """Test logging with JSON format."""
-        logger = EnhancedLogger(
-            level="INFO", terminal=False, fileout_path=temp_log_file
-        )
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
         data = {"key": "value"}
+        attach_caplog(logger)
         logger.info("Data: %s", data, json_format=True)
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert '"key": "value"' in content
+        message = caplog.records[-1].getMessage()
+        assert message == 'Data: {"key":"value"}'
+
+    def test_logging_with_json_indent(self, caplog, attach_caplog):
+        """Test logging with indented JSON format."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        data = {"key": "value"}
+        attach_caplog(logger)
+        logger.info("Data: %s", data, json_format=True, json_indent=4)
+        message = caplog.records[-1].getMessage()
+        assert message == 'Data: {\n    "key": "value"\n}'
 
-    def test_logging_with_truncate_override(self, temp_log_file):
+    def test_logging_with_truncate_override(self, caplog, attach_caplog):
         """Test logging with truncate parameter override."""
         logger = EnhancedLogger(
             level="INFO",
             truncate=True,
             truncate_length=10,
             terminal=False,
-            fileout_path=temp_log_file,
+            fileout_path=None,
         )
+        attach_caplog(logger)
         logger.info("Short message that would be truncated", truncate=False)
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "TRUNCATED" not in content
+        message = caplog.records[-1].getMessage()
+        assert message == "Short message that would be truncated"
 
-    def test_logging_with_truncate_length_override(self, temp_log_file):
+    def test_logging_with_truncate_length_override(self, caplog, attach_caplog):
         """Test logging with truncate_length parameter override."""
         logger = EnhancedLogger(
             level="INFO",
             truncate=True,
             truncate_length=10000,
             terminal=False,
-            fileout_path=temp_log_file,
+            fileout_path=None,
         )
+        attach_caplog(logger)
         logger.info("A" * 100, truncate_length=10)
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "TRUNCATED" in content
+        message = caplog.records[-1].getMessage()
+        assert message == "AAAAAAAAAA... [TRUNCATED, LENGTH: 100]"
+
+    @pytest.mark.parametrize(
+        "method", ["debug", "info", "warning", "error", "critical"]
+    )
+    def test_record_points_at_caller(self, method):
+        """Test that records report the caller's file and line number."""
+        logger = EnhancedLogger(level="DEBUG", terminal=False, fileout_path=None)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.logger.addHandler(handler)
+        try:
+            getattr(logger, method)("Caller location")
+            expected_lineno = sys._getframe().f_lineno - 1
+        finally:
+            logger.logger.removeHandler(handler)
+        assert records[0].filename == os.path.basename(__file__)
+        assert records[0].lineno == expected_lineno
+
+    def test_disabled_level_skips_formatting(self, log_sink):
+        """Test that disabled levels return before formatting the message."""
+        _, handler = log_sink
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        logger.logger.addHandler(handler)
+        try:
+            with patch.object(
+                EnhancedLogger, "_format_message", return_value="formatted"
+            ) as mock_format:
+                logger.debug("Debug message %s", "arg")
+                mock_format.assert_not_called()
+                logger.info("Info message %s", "arg")
+                mock_format.assert_called_once()
+        finally:
+            logger.logger.removeHandler(handler)
+
+    def test_filtered_record_skips_formatting(self, log_sink):
+        """Test that records rejected by a filter are never formatted."""
+        stream, handler = log_sink
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        handler.addFilter(lambda record: False)
+        # Only the filtered handler: pytest's capture handlers would format it.
+        with patch.object(logger.logger, "handlers", [handler]):
+            with patch.object(EnhancedLogger, "_format_message") as mock_format:
+                logger.info("Filtered message %s", "arg")
+                mock_format.assert_not_called()
+        assert stream.getvalue() == ""
+
+    def test_settings_resolved_when_logged(self):
+        """Test that changing settings later does not alter logged records."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.logger.addHandler(handler)
+        try:
+            logger.info("hello, this message is long")
+        finally:
+            logger.logger.removeHandler(handler)
+        logger.truncate_length = 5
+        assert records[0].getMessage() == "hello, this message is long"
+
+    def test_record_msg_supports_string_methods(self):
+        """Test that filters can call str methods on the lazy record msg."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        handler.addFilter(lambda record: not record.msg.startswith("skip"))
+        logger.logger.addHandler(handler)
+        try:
+            logger.info("skip %s", "me")
+            logger.info("keep %s", "me")
+        finally:
+            logger.logger.removeHandler(handler)
+        assert [record.getMessage() for record in records] == ["keep me"]
+
+    def test_record_msg_repr_does_not_format(self):
+        """Test the lazy msg repr shows the template before formatting."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        # Only this handler: pytest's capture handlers would format the record.
+        with patch.object(logger.logger, "handlers", [handler]):
+            logger.info("Value %s", "x")
+        assert repr(records[0].msg) == "<_LazyMessage 'Value %s'>"
+        records[0].getMessage()
+        assert repr(records[0].msg) == "'Value x'"
+
+    def test_record_msg_is_not_a_str(self):
+        """Test the documented contract that record.msg is not a str."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        with patch.object(logger.logger, "handlers", [handler]):
+            logger.info("Value %s", "x")
+        msg = records[0].msg
+        assert not isinstance(msg, str)
+        assert msg != "Value x"
+        with pytest.raises(TypeError):
+            len(msg)
+        assert str(msg) == records[0].getMessage() == "Value x"
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"user_context": ["uid", "user123"]},
+            {"user_context": "user123"},
+            {"truncate_length": "100"},
+        ],
+    )
+    def test_invalid_arguments_raise_at_call(self, kwargs):
+        """Test that bad argument types raise when logging, not when emitting."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        handler = logging.Handler()
+        handler.addFilter(lambda record: False)
+        with patch.object(logger.logger, "handlers", [handler]):
+            with pytest.raises(TypeError):
+                logger.info("Message", **kwargs)
+
+    def test_invalid_arguments_ignored_when_level_disabled(self):
+        """Test that disabled levels return before checking arguments."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        logger.debug("Message", user_context="user123")
+
+    def test_record_message_formatted_once_for_all_handlers(self):
+        """Test that every handler sees the same lazily formatted message."""
+        logger = EnhancedLogger(level="INFO", terminal=False, fileout_path=None)
+        streams = [StringIO(), StringIO()]
+        handlers = [logging.StreamHandler(stream) for stream in streams]
+        for handler in handlers:
+            logger.logger.addHandler(handler)
+        try:
+            with patch.object(
+                EnhancedLogger, "_format_message", return_value="Formatted once"
+            ) as mock_format:
+                logger.info("Message %s", "arg")
+                mock_format.assert_called_once()
+        finally:
+            for handler in handlers:
+                logger.logger.removeHandler(handler)
+        for stream in streams:
+            assert stream.getvalue() == "Formatted once\n"
 
 
 class TestEnhancedLoggerGetMethods:
@@ -785,28 +1283,40 @@ class TestGetLoggerFunction:
 class TestTimezoneUtilities:
     """Tests for timezone utility functions."""
 
-    def test_get_available_timezones(self):
-        """Test get_available_timezones returns a set of timezones."""
-        timezones = get_available_timezones()
-        assert isinstance(timezones, set)
-        assert len(timezones) > 0
+    @pytest.mark.slow
+    def test_get_available_timezones(self, all_tz):
+        """Test get_available_timezones returns a frozenset of timezones."""
+        assert isinstance(all_tz, frozenset)
+        assert len(all_tz) > 0
         # Check for some common timezones.
-        assert "UTC" in timezones
-        assert "America/New_York" in timezones
-        assert "Europe/London" in timezones
-
-    def test_is_valid_timezone_with_valid(self):
+        assert "UTC" in all_tz
+        assert "America/New_York" in all_tz
+        assert "Europe/London" in all_tz
+
+    @pytest.mark.slow
+    def test_get_available_timezones_is_cached(self, all_tz):
+        """Test repeated calls return the same cached frozenset."""
+        assert get_available_timezones() is all_tz
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "tz", ["UTC", "America/New_York", "Europe/London", "Asia/Tokyo"]
+    )
+    def test_is_valid_timezone_with_valid(self, tz):
         """Test is_valid_timezone returns True for valid timezone."""
-        assert is_valid_timezone("UTC") is True
-        assert is_valid_timezone("America/New_York") is True
-        assert is_valid_timezone("Europe/London") is True
-        assert is_valid_timezone("Asia/Tokyo") is True
+        assert is_valid_timezone(tz) is True
 
-    def test_is_valid_timezone_with_invalid(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("tz", ["Invalid/Timezone", "Not_A_Timezone", ""])
+    def test_is_valid_timezone_with_invalid(self, tz):
         """Test is_valid_timezone returns False for invalid timezone."""
-        assert is_valid_timezone("Invalid/Timezone") is False
-        assert is_valid_timezone("Not_A_Timezone") is False
-        assert is_valid_timezone("") is False
+        assert is_valid_timezone(tz) is False
+
+    def test_is_valid_timezone_empty_skips_lookup(self):
+        """Test is_valid_timezone rejects empty input without a set lookup."""
+        with patch.object(_el, "get_available_timezones") as mock_available:
+            assert is_valid_timezone("") is False
+        mock_available.assert_not_called()
 
 
 class TestLoggerWithTimezone:
@@ -821,10 +1331,8 @@ class TestLoggerWithTimezone:
             fileout_path=temp_log_file,
         )
         logger.info("Test message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
         # Should contain UTC timezone indicator.
-        assert "UTC" in content or "+0000" in content
+        assert _contains(temp_log_file, b"UTC") or _contains(temp_log_file, b"+0000")
 
     def test_logger_with_specific_timezone(self, temp_log_file):
         """Test logger with specific timezone."""
@@ -835,98 +1343,263 @@ class TestLoggerWithTimezone:
             fileout_path=temp_log_file,
         )
         logger.info("Test message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
         # Should contain timezone info.
-        assert "Test message" in content
+        assert _contains(temp_log_file, b"Test message")
 
-
-class TestLoggerFileOutput:
-    """Tests for logger file output functionality."""
-
-    def test_logs_written_to_file(self, temp_log_file):
-        """Test that logs are written to file."""
+    def test_set_timezone_switches_timestamps(self, temp_log_file):
+        """Test set_timezone changes the zone of later records in place."""
         logger = EnhancedLogger(
             level="INFO",
+            timezone="Asia/Tokyo",
             terminal=False,
             fileout_path=temp_log_file,
         )
-        logger.info("File output test")
+        (file_handler,) = _installed(logger)
+        logger.info("Tokyo message")
+        logger.set_timezone("UTC")
+        logger.info("UTC message")
+        assert logger.timezone == "UTC"
+        assert _installed(logger) == [file_handler]
         with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "File output test" in content
+            tokyo_line, utc_line = f.read().splitlines()
+        assert "JST+0900" in tokyo_line
+        assert "UTC+0000" in utc_line
 
-    def test_multiple_logs_appended(self, temp_log_file):
-        """Test that multiple logs are appended to file."""
+    def test_set_timezone_updates_async_file_formatter(self, temp_log_file):
+        """Test set_timezone reaches the formatter owned by the listener."""
         logger = EnhancedLogger(
-            level="INFO",
-            terminal=False,
-            fileout_path=temp_log_file,
+            terminal=False, fileout_path=temp_log_file, async_file=True
         )
+        try:
+            logger.set_timezone("UTC")
+            (file_handler,) = logger._listener.handlers
+            assert file_handler.formatter.timezone == "UTC"
+        finally:
+            logger.reconfigure(async_file=False)
+
+
+class TestLoggerFileOutput:
+    """Tests for logger file output functionality."""
+
+    def test_logs_written_to_file(self, file_logger, temp_log_file):
+        """Test that logs are written to file."""
+        file_logger.info("File output test")
+        assert _contains(temp_log_file, b"File output test")
+
+    def test_multiple_logs_appended(self, stream_logger):
+        """Test that multiple logs are appended to the output."""
+        logger, buf = stream_logger
         logger.info("First message")
         logger.info("Second message")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "First message" in content
-        assert "Second message" in content
+        assert "First message" in buf.getvalue()
+        assert "Second message" in buf.getvalue()
+
+    def test_file_contains_timestamp(self, stream_logger):
+        """Test that file-format output contains a timestamp."""
+        logger, buf = stream_logger
+        logger.info("Timestamp test")
+        content = buf.getvalue()
+        # Should contain a date like YYYY-MM-DD or time like HH:MM:SS.
+        assert _DATE_RE.search(content) or _TIME_RE.search(content)
+
+    def test_file_contains_level(self, stream_logger):
+        """Test that file-format output contains the log level."""
+        logger, buf = stream_logger
+        logger.info("Level test")
+        assert "INFO" in buf.getvalue()
+
+    def test_stream_handler_kept_on_reconfigure(self, stream_logger):
+        """Test that an added stream handler survives reconfigure()."""
+        logger, buf = stream_logger
+        logger.reconfigure(terminal=True)
+        logger.info("Still captured")
+        assert "Still captured" in buf.getvalue()
+        assert "\033[" not in buf.getvalue()
+
 
-    def test_file_contains_timestamp(self, temp_log_file):
-        """Test that log file contains timestamp."""
+class TestLoggerAsyncFileOutput:
+    """Tests for logger file output through the background queue listener."""
+
+    def test_async_file_installs_queue_handler(self, temp_log_file):
+        """Test that async_file routes file output through a queue."""
         logger = EnhancedLogger(
-            level="INFO",
-            terminal=False,
-            fileout_path=temp_log_file,
+            terminal=False, fileout_path=temp_log_file, async_file=True
         )
-        logger.info("Timestamp test")
+        try:
+            assert len(_installed(logger)) == 1
+            assert isinstance(_installed(logger)[0], QueueHandler)
+            assert logger._listener is not None
+        finally:
+            logger.reconfigure(async_file=False)
+
+    def test_async_file_writes_after_flush(self, temp_log_file):
+        """Test that queued records are on disk after flush()."""
+        logger = EnhancedLogger(
+            level="INFO", terminal=False, fileout_path=temp_log_file, async_file=True
+        )
+        try:
+            logger.info("First async message")
+            logger.info("Second async message")
+            logger.flush()
+            assert _contains(temp_log_file, b"First async message")
+            assert _contains(temp_log_file, b"Second async message")
+            # Source location still points at the caller.
+            assert _contains(temp_log_file, b"test_enhanced_logger.py")
+        finally:
+            logger.reconfigure(async_file=False)
+
+    def test_reconfigure_disables_async_file(self, temp_log_file):
+        """Test that turning async_file off stops the listener thread."""
+        logger = EnhancedLogger(
+            terminal=False, fileout_path=temp_log_file, async_file=True
+        )
+        listener = logger._listener
+        logger.info("Queued before reconfigure")
+        logger.reconfigure(async_file=False)
+        assert logger._listener is None
+        assert listener._thread is None
+        assert isinstance(_installed(logger)[0], logging.FileHandler)
+        assert _contains(temp_log_file, b"Queued before reconfigure")
+
+    def test_concurrent_flush_keeps_listener_running(self, temp_log_file):
+        """Test that flush() from several threads loses no records."""
+        logger = EnhancedLogger(
+            level="INFO", terminal=False, fileout_path=temp_log_file, async_file=True
+        )
+        listener = logger._listener
+        errors = []
+
+        def work(worker):
+            try:
+                for i in range(50):
+                    logger.info(f"worker {worker} message {i}")
+                    logger.flush()
+            except Exception as error:  # pragma: no cover - reported below
+                errors.append(error)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == []
+            assert logger._listener is listener
+            assert listener._thread.is_alive()
+            content = Path(temp_log_file).read_bytes()
+            for worker in range(4):
+                for i in range(50):
+                    assert f"worker {worker} message {i}\n".encode() in content
+        finally:
+            logger.reconfigure(async_file=False)
+
+    def test_new_logger_stops_replaced_listener(self, temp_log_file):
+        """Test that replacing an async logger stops its listener thread."""
+        name = f"loggio-{uuid4().hex}"
+        first = EnhancedLogger(
+            name=name, terminal=False, fileout_path=temp_log_file, async_file=True
+        )
+        thread = first._listener._thread
+        first.info("Written by the first logger")
+        EnhancedLogger(name=name, terminal=False, fileout_path=None)
+        assert not thread.is_alive()
+        assert first._listener._thread is None
+        assert _contains(temp_log_file, b"Written by the first logger")
+
+
+class TestLoggerBufferedFileOutput:
+    """Tests for logger file output through the write-buffered file handler."""
+
+    def test_buffered_records_written_on_flush(self, temp_log_file):
+        """Test that INFO records stay buffered until flush()."""
+        logger = EnhancedLogger(
+            level="INFO", terminal=False, fileout_path=temp_log_file, buffer_file=True
+        )
+        logger.info("Buffered message")
         with open(temp_log_file, "r") as f:
-            content = f.read()
-        # Should contain date-like pattern.
-        import re
+            assert f.read() == ""
+        logger.flush()
+        assert _contains(temp_log_file, b"Buffered message")
 
-        # Pattern for date like YYYY-MM-DD or time like HH:MM:SS.
-        assert re.search(r"\d{4}-\d{2}-\d{2}", content) or re.search(
-            r"\d{2}:\d{2}:\d{2}", content
+    def test_error_record_flushes_buffer(self, temp_log_file):
+        """Test that an ERROR record flushes itself and earlier records."""
+        logger = EnhancedLogger(
+            level="INFO", terminal=False, fileout_path=temp_log_file, buffer_file=True
         )
+        logger.info("Before error")
+        logger.error("Error message")
+        assert _contains(temp_log_file, b"Before error")
+        assert _contains(temp_log_file, b"Error message")
 
-    def test_file_contains_level(self, temp_log_file):
-        """Test that log file contains log level."""
+    def test_full_buffer_written_without_flush(self, temp_log_file):
+        """Test that the buffer is written out once it reaches its size."""
         logger = EnhancedLogger(
             level="INFO",
             terminal=False,
             fileout_path=temp_log_file,
+            buffer_file=True,
+            truncate=False,
         )
-        logger.info("Level test")
-        with open(temp_log_file, "r") as f:
-            content = f.read()
-        assert "INFO" in content
+        (file_handler,) = _installed(logger)
+        # Unbuffered raw file, so a buffer write goes straight to the fd.
+        assert isinstance(file_handler.stream, FileIO)
+        logger.info("x" * _el._FILE_BUFFER_SIZE)
+        assert not file_handler._buffer
+        assert os.path.getsize(temp_log_file) > _el._FILE_BUFFER_SIZE
+
+    def test_reconfigure_disables_buffer_file(self, temp_log_file):
+        """Test turning buffer_file off installs a plain FileHandler."""
+        logger = EnhancedLogger(
+            terminal=False, fileout_path=temp_log_file, buffer_file=True
+        )
+        logger.info("Buffered before reconfigure")
+        logger.reconfigure(buffer_file=False)
+        (file_handler,) = _installed(logger)
+        assert type(file_handler) is logging.FileHandler
+        # Closing the buffered handler wrote out its pending records.
+        assert _contains(temp_log_file, b"Buffered before reconfigure")
 
 
 class TestLoggerTerminalOutput:
     """Tests for logger terminal output functionality."""
 
-    def test_terminal_output_with_colors(self, capsys):
+    def test_terminal_output_with_colors(self, capfdbinary, colored_terminal_logger):
         """Test terminal output includes colors when enabled."""
+        colored_terminal_logger.info("Colored output test")
+        # Flush so any bytes buffered in sys.stderr reach fd 2 before reading.
+        colored_terminal_logger.flush()
+        captured = capfdbinary.readouterr()
+        # The record starts with the colored level name.
+        assert captured.err.startswith(b"\x1b[")
+
+    def test_terminal_output_without_colors(
+        self, capfdbinary, plain_terminal_logger
+    ):
+        """Test terminal output without colors when disabled."""
+        plain_terminal_logger.info("No color output test")
+        plain_terminal_logger.flush()
+        captured = capfdbinary.readouterr()
+        # Should not contain ANSI color codes.
+        assert b"\033[" not in captured.err
+        assert b"No color output test" in captured.err
+
+    def test_terminal_output_follows_redirected_stderr(self):
+        """Test the terminal handler writes to sys.stderr as of each record."""
         logger = EnhancedLogger(
-            level="INFO",
-            terminal=True,
-            fileout_path=None,
-            use_colors=True,
+            level="INFO", terminal=True, fileout_path=None, use_colors=False
         )
-        logger.info("Colored output test")
-        captured = capsys.readouterr()
-        # Should contain ANSI color codes.
-        assert "\033[" in captured.err
+        stream = StringIO()
+        with contextlib.redirect_stderr(stream):
+            logger.info("Redirected output test")
+        assert "Redirected output test" in stream.getvalue()
 
-    def test_terminal_output_without_colors(self, capsys):
-        """Test terminal output without colors when disabled."""
+    def test_terminal_handler_set_stream(self):
+        """Test setStream() on the terminal handler redirects its output."""
         logger = EnhancedLogger(
-            level="INFO",
-            terminal=True,
-            fileout_path=None,
-            use_colors=False,
+            level="INFO", terminal=True, fileout_path=None, use_colors=False
         )
-        logger.info("No color output test")
-        captured = capsys.readouterr()
-        # Should not contain ANSI color codes.
-        assert "\033[" not in captured.err
-        assert "No color output test" in captured.err
+        (terminal_handler,) = _installed(logger)
+        stream = StringIO()
+        assert terminal_handler.setStream(stream) is sys.stderr
+        logger.info("Set stream output test")
+        assert "Set stream output test" in stream.getvalue()
@@ -1,61 +1,46 @@
 """Tests for the package __init__.py module."""
 
+import os
+import subprocess
+import sys
+
 import pytest
 
+import loggio
+
 
 class TestPackageImports:
     """Tests for package-level imports and exports."""
 
-    def test_import_colors(self):
-        """Test that Colors can be imported from loggio."""
-        from loggio import Colors
-
-        assert Colors is not None
-        assert hasattr(Colors, "RESET")
-
-    def test_import_colored_formatter(self):
-        """Test that ColoredFormatter can be imported from loggio."""
-        from loggio import ColoredFormatter
-
-        assert ColoredFormatter is not None
-
-    def test_import_enhanced_logger(self):
-        """Test that EnhancedLogger can be imported from loggio."""
-        from loggio import EnhancedLogger
-
-        assert EnhancedLogger is not None
-
-    def test_import_get_logger(self):
-        """Test that get_logger can be imported from loggio."""
-        from loggio import get_logger
-
-        assert callable(get_logger)
-
-    def test_import_get_available_timezones(self):
-        """Test that get_available_timezones can be imported from loggio."""
-        from loggio import get_available_timezones
-
-        assert callable(get_available_timezones)
-
-    def test_import_is_valid_timezone(self):
-        """Test that is_valid_timezone can be imported from loggio."""
-        from loggio import is_valid_timezone
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "Colors",
+            "ColoredFormatter",
+            "EnhancedLogger",
+            "get_logger",
+            "get_available_timezones",
+            "is_valid_timezone",
+        ],
+    )
+    def test_import_public_name(self, name):
+        """Test that each public class and function can be imported from loggio."""
+        # Classes and functions alike are callable.
+        assert callable(getattr(loggio, name))
 
-        assert callable(is_valid_timezone)
+    def test_import_colors(self):
+        """Test that Colors exposes its color constants."""
+        assert hasattr(loggio.Colors, "RESET")
 
     def test_package_version(self):
         """Test that __version__ is defined."""
-        from loggio import __version__
-
-        assert __version__ is not None
-        assert isinstance(__version__, str)
+        assert loggio.__version__ is not None
+        assert isinstance(loggio.__version__, str)
         # Version should match expected pattern.
-        assert "." in __version__ or __version__.startswith("20")
+        assert "." in loggio.__version__ or loggio.__version__.startswith("20")
 
     def test_package_all_exports(self):
         """Test that __all__ contains expected exports."""
-        from loggio import __all__
-
         expected_exports = [
             "ColoredFormatter",
             "Colors",
@@ -65,13 +50,44 @@ class TestPackageImports:
             "is_valid_timezone",
         ]
         for export in expected_exports:
-            assert export in __all__
+            assert export in loggio.__all__
 
     def test_all_exports_are_importable(self):
         """Test that all items in __all__ can be imported."""
-        import loggio
-
         for name in loggio.__all__:
             assert hasattr(loggio, name)
             obj = getattr(loggio, name)
             assert obj is not None
+
+    def test_import_defers_enhanced_logger(self):
+        """Test that importing loggio does not load enhanced_logger yet."""
+        code = (
+            "import sys, loggio; "
+            "assert 'loggio.enhanced_logger' not in sys.modules; "
+            "assert 'Colors' in dir(loggio); "
+            "loggio.Colors; "
+            "assert 'loggio.enhanced_logger' in sys.modules"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        assert result.returncode == 0
+
+    def test_unknown_attribute_raises(self):
+        """Test that names outside __all__ raise AttributeError."""
+        with pytest.raises(AttributeError):
+            loggio.not_a_name
+
+    def test_submodule_attribute_loads_on_access(self):
+        """Test that loggio.enhanced_logger works after a bare import loggio."""
+        code = (
+            "import sys, loggio; "
+            "assert 'loggio.enhanced_logger' not in sys.modules; "
+            "assert loggio.enhanced_logger.EnhancedLogger is loggio.EnhancedLogger"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        assert result.returncode == 0